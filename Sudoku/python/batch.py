@@ -0,0 +1,212 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from itertools import islice
+from multiprocessing import Event
+from multiprocessing.synchronize import Event as EventType
+import os
+from typing import Iterable, Iterator, Literal
+
+from result import SolveResult
+from sudoku import Sudoku9x9, SudokuBase
+
+BOARD = list[list[int]] | list[int]
+
+
+def solve_many(
+    boards: Iterable[BOARD | None],
+    sudoku_class: type[SudokuBase] = Sudoku9x9,
+    workers: int | None = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    method: Literal["minimum_case_first", "brute_forcing", "dlx"] = "minimum_case_first",
+    optimized: bool = True,
+    timeout: float | None = None,
+    detailed: bool = False,
+) -> Iterator[list[int] | None] | Iterator[tuple[int, list[int] | None]]:
+    """
+    solves boards of one sudoku_class over a process pool, chunksize boards per task\n
+    ordered: yields each solution (None if invalid, unsolvable or timed out) in
+    input order; otherwise yields (input index, solution) as chunks complete\n
+    a None board (e.g. a line read_puzzles() could not parse) is invalid\n
+    timeout: seconds per board, see SudokuBase.solve()\n
+    detailed: yields the SolveResult of each board instead of its solution
+    (still None for an invalid board)\n
+    boards is read lazily, with at most 2 * workers chunks in flight; if reading
+    it raises, the chunks in flight are yielded first
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(boards, chunksize)
+    task = (sudoku_class, method, optimized)
+    options = (timeout, detailed)
+    if workers == 1:
+        for start, chunk in chunks:
+            solutions = solve_chunk(*task, chunk, *options)
+            for offset, solution in enumerate(solutions):
+                yield solution if ordered else (start + offset, solution)
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        in_flight: deque[tuple[int, Future]] = deque()
+        try:
+            for start, chunk in chunks:
+                in_flight.append(
+                    (
+                        start,
+                        executor.submit(solve_chunk, *task, chunk, *options),
+                    )
+                )
+                if len(in_flight) >= 2 * workers:
+                    yield from _drain(in_flight, ordered, False)
+        except Exception:
+            yield from _drain(in_flight, ordered, True)
+            raise
+        yield from _drain(in_flight, ordered, True)
+
+
+def solve_chunk(
+    sudoku_class: type[SudokuBase],
+    method: Literal["minimum_case_first", "brute_forcing", "dlx"],
+    optimized: bool,
+    chunk: list[BOARD | None],
+    timeout: float | None = None,
+    detailed: bool = False,
+) -> list[list[int] | None] | list[SolveResult | None]:
+    solutions: list = list()
+    sudoku = None
+    for board in chunk:
+        if board is None:  # not a puzzle
+            solutions.append(None)
+            continue
+        try:
+            if sudoku is None:
+                sudoku = sudoku_class(board=board).optimize(optimized)
+            else:
+                sudoku.reset(board)
+        except Exception:  # "Invalid Board Provided"
+            solutions.append(None)
+            continue
+        result = sudoku.solve(method, timeout=timeout)
+        solutions.append(result if detailed else result.solution)
+    return solutions
+
+
+def _chunks(
+    boards: Iterable[BOARD | None], chunksize: int
+) -> Iterator[tuple[int, list[BOARD | None]]]:
+    """
+    the boards read before boards raises are yielded as a last, shorter chunk
+    """
+    iterator = iter(boards)
+    start = 0
+    while True:
+        chunk: list[BOARD | None] = list()
+        try:
+            chunk.extend(islice(iterator, chunksize))
+        except Exception:
+            if chunk:
+                yield start, chunk
+            raise
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _drain(
+    in_flight: deque[tuple[int, Future]], ordered: bool, everything: bool
+) -> Iterator[list[int] | None] | Iterator[tuple[int, list[int] | None]]:
+    """
+    ordered: yields the oldest chunk (all of them if everything)\n
+    otherwise: yields whichever chunks are done (waiting for at least one)
+    """
+    while in_flight:
+        if ordered:
+            _, future = in_flight.popleft()
+            yield from future.result()
+        else:
+            wait([future for _, future in in_flight], return_when=FIRST_COMPLETED)
+            for start, future in [item for item in in_flight if item[1].done()]:
+                in_flight.remove((start, future))
+                for offset, solution in enumerate(future.result()):
+                    yield start + offset, solution
+        if not everything:
+            return
+
+
+def solve_parallel(
+    sudoku: SudokuBase,
+    workers: int | None = None,
+    method: Literal["minimum_case_first", "brute_forcing"] = "minimum_case_first",
+    subproblems: int | None = None,
+    slice_nodes: int = 256,
+) -> bool:
+    """
+    solves one board on a process pool: the top levels of the search tree are
+    expanded until there are at least subproblems (default 4 * workers) boards,
+    idle workers take the next board from the shared queue, and the first solution
+    found stops the others after at most slice_nodes more nodes\n
+    the solution is put on sudoku, as solve() would
+    """
+    workers = workers or os.cpu_count() or 1
+    subproblems = subproblems or 4 * workers
+    boards: list[list[int]] = list()
+    for depth in range(sudoku._N * sudoku._N):
+        boards = list(sudoku.search(method).split(depth))
+        if len(boards) >= subproblems or not boards or 0 not in boards[0]:
+            break
+
+    solution = None
+    stop = Event()
+    with ProcessPoolExecutor(
+        workers, initializer=_init_subtree_worker, initargs=(stop,)
+    ) as executor:
+        futures = [
+            executor.submit(
+                solve_subtree, type(sudoku), method, sudoku._optimized, board, slice_nodes
+            )
+            for board in boards
+        ]
+        for future in as_completed(futures):
+            solution = future.result()
+            if solution is not None:
+                stop.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+                break
+
+    sudoku._reset()
+    if solution is None:
+        return False
+    for idx, value in enumerate(solution):
+        if not sudoku._board[idx]:
+            sudoku.put(idx, value)
+    return True
+
+
+_stop: EventType | None = None
+
+
+def _init_subtree_worker(stop: EventType) -> None:
+    global _stop
+    _stop = stop
+
+
+def solve_subtree(
+    sudoku_class: type[SudokuBase],
+    method: Literal["minimum_case_first", "brute_forcing"],
+    optimized: bool,
+    board: list[int],
+    slice_nodes: int,
+) -> list[int] | None:
+    sudoku = sudoku_class(board=board).optimize(optimized)
+    search = sudoku.search(method)
+    while _stop is None or not _stop.is_set():
+        result = search.run(max_nodes=slice_nodes)
+        if result is not None:
+            return sudoku._board.tolist() if result else None
+    return None
@@ -0,0 +1,316 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Literal
+
+from generator import generate
+from sudoku import (
+    Sudoku4x4,
+    Sudoku6x6h,
+    Sudoku6x6v,
+    Sudoku8x8h,
+    Sudoku8x8v,
+    Sudoku9x9,
+    Sudoku12x12h,
+    Sudoku12x12v,
+    Sudoku16x16,
+    Sudoku20x20h,
+    Sudoku20x20v,
+    Sudoku25x25,
+    Sudoku36x36,
+    Sudoku121x121,
+    SudokuNxN,
+)
+from vars import BACKEND, DIFFICULTY
+import vectorized
+
+TOPOLOGIES: dict[str, type[SudokuNxN]] = {
+    "4x4": Sudoku4x4,
+    "6x6h": Sudoku6x6h,
+    "6x6v": Sudoku6x6v,
+    "8x8h": Sudoku8x8h,
+    "8x8v": Sudoku8x8v,
+    "9x9": Sudoku9x9,
+    "12x12h": Sudoku12x12h,
+    "12x12v": Sudoku12x12v,
+    "16x16": Sudoku16x16,
+    "20x20h": Sudoku20x20h,
+    "20x20v": Sudoku20x20v,
+    "25x25": Sudoku25x25,
+    "36x36": Sudoku36x36,
+    "121x121": Sudoku121x121,
+}
+
+LEVELS: tuple[DIFFICULTY, ...] = ("easy", "medium", "hard", "expert")
+
+# up to this N the corpus is carved by generator.generate() for each level, larger
+# boards keep this share of a random solution's cells as clues instead
+GENERATE_MAX_N = 9
+CLUE_SHARE: dict[DIFFICULTY, float] = {
+    "easy": 0.7,
+    "medium": 0.55,
+    "hard": 0.45,
+    "expert": 0.35,
+}
+
+# (method, optimized, backend)
+ENGINES: list[
+    tuple[Literal["minimum_case_first", "brute_forcing", "dlx"], bool, BACKEND]
+] = [
+    ("brute_forcing", False, "python"),
+    ("brute_forcing", True, "python"),
+    ("minimum_case_first", False, "python"),
+    ("minimum_case_first", True, "python"),
+    ("dlx", False, "python"),
+    ("minimum_case_first", False, "numpy"),
+]
+
+
+def make_corpus(
+    topologies: list[str], count: int, seed: int = 0
+) -> dict[str, dict[DIFFICULTY, list[list[int]]]]:
+    """
+    count puzzles per topology and level, the same for the same seed; a level
+    generate() cannot reach on a small grid (a 4x4 never needs guessing) stays empty
+    """
+    corpus: dict[str, dict[DIFFICULTY, list[list[int]]]] = dict()
+    for topology in topologies:
+        random.seed(f"{seed}:{topology}")
+        sudoku = TOPOLOGIES[topology]()
+        corpus[topology] = dict()
+        for level in LEVELS:
+            puzzles = list()
+            for _ in range(count):
+                if sudoku._N <= GENERATE_MAX_N:
+                    try:
+                        puzzles.append(
+                            generate(type(sudoku), difficulty=level, attempts=20)
+                        )
+                    except Exception:  # "No puzzle found ..."
+                        break
+                else:
+                    puzzles.append(_random_puzzle(sudoku, CLUE_SHARE[level]))
+            corpus[topology][level] = puzzles
+    return corpus
+
+
+def run(
+    corpus: dict[str, dict[DIFFICULTY, list[list[int]]]],
+    engines: list[tuple[str, bool, BACKEND]] = ENGINES,
+    repeat: int = 3,
+    timeout: float | None = 10.0,
+) -> list[dict[str, str | bool | int | float | None]]:
+    """
+    one entry per (topology, level, engine): median / p95 of the solve times over
+    every puzzle and repetition, nodes per second of search time, and the
+    tracemalloc peak of one more pass\n
+    an engine that times out on a level is not run on the harder levels
+    """
+    results = list()
+    for topology, levels in corpus.items():
+        sudoku_class = TOPOLOGIES[topology]
+        for method, optimized, backend in engines:
+            if backend == "numpy" and not vectorized.available():
+                continue
+            timed_out = False
+            for level, puzzles in levels.items():
+                if not puzzles:
+                    continue
+                entry: dict[str, str | bool | int | float | None] = {
+                    "topology": topology,
+                    "level": level,
+                    "method": method,
+                    "optimized": optimized,
+                    "backend": backend,
+                    "puzzles": len(puzzles),
+                }
+                if timed_out:
+                    entry["skipped"] = True
+                    results.append(entry)
+                    continue
+                times: list[float] = list()
+                nodes, search_time, solved, timeouts = 0, 0.0, 0, 0
+                for _ in range(repeat):
+                    for puzzle in puzzles:
+                        sudoku = sudoku_class(board=puzzle).optimize(optimized)
+                        result = sudoku.solve(method, backend, timeout)
+                        times.append(result.times["total"])
+                        nodes += result.nodes
+                        search_time += result.times.get("search", 0.0)
+                        solved += result.status == "solved"
+                        timeouts += result.status == "timeout"
+                entry.update(
+                    {
+                        "solved": solved,
+                        "timeouts": timeouts,
+                        "median": statistics.median(times),
+                        "p95": _percentile(times, 95),
+                        "nodes_per_sec": nodes / search_time if search_time else None,
+                        "peak_kib": _peak_memory(
+                            sudoku_class, puzzles, method, optimized, backend, timeout
+                        ),
+                    }
+                )
+                results.append(entry)
+                timed_out = timeouts > 0
+    return results
+
+
+def measure_memory(
+    topologies: list[str], repeat: int = 3, seed: int = 0
+) -> list[dict[str, str | int | float]]:
+    """
+    one entry per topology: median time to build an instance from a puzzle, and
+    the KiB one instance keeps (retained) and needs while being built (peak)
+    """
+    results = list()
+    for topology in topologies:
+        random.seed(f"{seed}:{topology}")
+        sudoku_class = TOPOLOGIES[topology]
+        puzzle = _random_puzzle(sudoku_class(), CLUE_SHARE["medium"])
+        times: list[float] = list()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            sudoku_class(board=puzzle)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            sudoku = sudoku_class(board=puzzle)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del sudoku
+        results.append(
+            {
+                "topology": topology,
+                "cells": len(puzzle),
+                "construct": statistics.median(times),
+                "retained_kib": retained / 1024,
+                "peak_kib": peak / 1024,
+            }
+        )
+    return results
+
+
+def compare(
+    report: dict, baseline: dict, tolerance: float = 1.2
+) -> list[dict[str, str | bool | int | float]]:
+    """
+    entries whose median got more than tolerance times slower than in baseline
+    """
+    key = lambda entry: tuple(
+        entry[name] for name in ("topology", "level", "method", "optimized", "backend")
+    )
+    before = {key(entry): entry for entry in baseline["results"] if "median" in entry}
+    regressions = list()
+    for entry in report["results"]:
+        old = before.get(key(entry))
+        if old is None or "median" not in entry or not old["median"]:
+            continue
+        ratio = entry["median"] / old["median"]
+        if ratio > tolerance:
+            regressions.append({**entry, "baseline": old["median"], "ratio": ratio})
+    return regressions
+
+
+def _random_puzzle(sudoku: SudokuNxN, share: float) -> list[int]:
+    sudoku._make_seed_board()
+    sudoku._shuffle_board()
+    board = sudoku._board
+    clues = set(random.sample(range(len(board)), int(len(board) * share)))
+    return [board[idx] if idx in clues else 0 for idx in range(len(board))]
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    if len(values) < 2:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def _peak_memory(
+    sudoku_class: type[SudokuNxN],
+    puzzles: list[list[int]],
+    method: str,
+    optimized: bool,
+    backend: BACKEND,
+    timeout: float | None,
+) -> float:
+    """
+    KiB, of building and solving the puzzles one at a time (tracemalloc slows the
+    solvers down, so it does not run while timing)
+    """
+    tracemalloc.start()
+    try:
+        for puzzle in puzzles:
+            sudoku_class(board=puzzle).optimize(optimized).solve(
+                method, backend, timeout
+            )
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sudoku solver benchmark")
+    parser.add_argument(
+        "--topologies", nargs="*", default=list(TOPOLOGIES), choices=list(TOPOLOGIES)
+    )
+    parser.add_argument("--count", type=int, default=5, help="puzzles per level")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per solve")
+    parser.add_argument("--output", help="report file, stdout by default")
+    parser.add_argument("--compare", help="baseline report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=1.2)
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure construction time and memory per topology instead of solving",
+    )
+    args = parser.parse_args()
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": vectorized.np.__version__ if vectorized.available() else None,
+        "seed": args.seed,
+        "count": args.count,
+        "repeat": args.repeat,
+        "timeout": args.timeout,
+    }
+    if args.memory:
+        report["memory"] = measure_memory(args.topologies, args.repeat, args.seed)
+    else:
+        report["results"] = run(
+            make_corpus(args.topologies, args.count, args.seed),
+            repeat=args.repeat,
+            timeout=args.timeout,
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare and not args.memory:
+        with open(args.compare) as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+        for entry in regressions:
+            print(
+                f"{entry['topology']} {entry['level']} {entry['method']}"
+                f" optimized={entry['optimized']} {entry['backend']}:"
+                f" {entry['baseline']:.4f}s -> {entry['median']:.4f}s"
+                f" ({entry['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
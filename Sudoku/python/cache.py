@@ -0,0 +1,193 @@
+import hashlib
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sudoku import SudokuBase
+    from transform import Transform
+
+
+class SolutionCache:
+    """
+    sqlite3 store of solutions, see SudokuBase.use_cache()\n
+    each puzzle is stored under its exact board and, with canonical, under its
+    canonical form, so a symmetric copy of a solved puzzle is a hit as well
+    (its solution is translated back through the symmetry)\n
+    max_entries: least recently used entries are evicted beyond it\n
+    canonical_max_N / canonical_min_clues: larger or sparser boards (share of
+    filled cells) only get the exact key, their canonical form can take longer
+    than solving them\n
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_entries: int = 100000,
+        canonical: bool = True,
+        canonical_max_N: int = 16,
+        canonical_min_clues: float = 0.2,
+    ):
+        self.path: str = path
+        self.max_entries: int = max_entries
+        self.canonical: bool = canonical
+        self.canonical_max_N: int = canonical_max_N
+        self.canonical_min_clues: float = canonical_min_clues
+        self.hits: int = 0
+        self.misses: int = 0
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS solutions"
+            " (key TEXT PRIMARY KEY, solution BLOB NOT NULL, used INTEGER NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)"
+        )
+        self._size: int
+        self._clock: int
+        self._size, self._clock = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(used), 0) FROM solutions"
+        ).fetchone()
+        # canonical key and transform of the last get() miss, reused by put()
+        self._pending: tuple[str, str, "Transform"] | None = None
+        # last use of the keys hit since the last write, flushed in one transaction
+        self._touched: dict[str, int] = dict()
+
+    def get(
+        self, sudoku: "SudokuBase", deadline: float | None = None
+    ) -> list[int] | None:
+        """
+        the solution of sudoku's initial board, [] if it is known to be unsolvable,
+        None on a miss\n
+        deadline: time.perf_counter() value; a canonical form not found by then
+        counts as a miss
+        """
+        key = self.__exact_key(sudoku)
+        solution = self.__lookup(key)
+        if solution is None and self.__canonical(sudoku):
+            found = sudoku.canonical_form(deadline)
+            if found is None:
+                self.misses += 1
+                return None
+            form, transform = found
+            canonical_key = self.__key(sudoku, form, "canonical")
+            self._pending = (key, canonical_key, transform)
+            solution = self.__lookup(canonical_key)
+            if solution:
+                solution = transform.inverse().apply(solution)
+            if solution is not None:
+                self.__store(key, solution)
+        if solution is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return solution
+
+    def put(
+        self,
+        sudoku: "SudokuBase",
+        solution: list[int] | None,
+        deadline: float | None = None,
+    ) -> None:
+        """
+        solution: None or [] if the initial board is unsolvable\n
+        deadline: as in get(), past it only the exact key is stored
+        """
+        solution = solution or []
+        key = self.__exact_key(sudoku)
+        self.__store(key, solution)
+        if not self.__canonical(sudoku):
+            return
+        if self._pending is None or self._pending[0] != key:
+            found = sudoku.canonical_form(deadline)
+            if found is None:
+                return
+            form, transform = found
+            self._pending = (key, self.__key(sudoku, form, "canonical"), transform)
+        _, canonical_key, transform = self._pending
+        self.__store(canonical_key, transform.apply(solution) if solution else [])
+        self._pending = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": self._size,
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> "SolutionCache":
+        self._touched.clear()
+        self._connection.execute("DELETE FROM solutions")
+        self._size = 0
+        self.hits = self.misses = 0
+        return self
+
+    def close(self) -> None:
+        self.__flush()
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __lookup(self, key: str) -> list[int] | None:
+        row = self._connection.execute(
+            "SELECT solution FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._clock += 1
+        self._touched[key] = self._clock
+        if len(self._touched) >= 256:
+            self.__flush()
+        return list(row[0])
+
+    def __flush(self) -> None:
+        if not self._touched:
+            return
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "UPDATE solutions SET used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+        self._touched.clear()
+
+    def __store(self, key: str, solution: list[int]) -> None:
+        self._clock += 1
+        inserted = self._connection.execute(
+            "INSERT OR IGNORE INTO solutions VALUES (?, ?, ?)",
+            (key, bytes(solution), self._clock),
+        ).rowcount
+        if not inserted:
+            self._connection.execute(
+                "UPDATE solutions SET solution = ?, used = ? WHERE key = ?",
+                (bytes(solution), self._clock, key),
+            )
+            return
+        self._size += 1
+        if self._size > self.max_entries:
+            self.__flush()
+            self._size -= self._connection.execute(
+                "DELETE FROM solutions WHERE key IN"
+                " (SELECT key FROM solutions ORDER BY used LIMIT ?)",
+                (self._size - self.max_entries,),
+            ).rowcount
+
+    def __canonical(self, sudoku: "SudokuBase") -> bool:
+        board = sudoku._INIT_BOARD
+        return (
+            self.canonical
+            and sudoku._N <= self.canonical_max_N
+            and len(board) - board.count(0) >= self.canonical_min_clues * len(board)
+        )
+
+    def __exact_key(self, sudoku: "SudokuBase") -> str:
+        return self.__key(sudoku, sudoku._INIT_BOARD, "exact")
+
+    def __key(self, sudoku: "SudokuBase", board: list[int], kind: str) -> str:
+        return (
+            f"{sudoku._type}:{kind}:"
+            + hashlib.blake2b(bytes(board), digest_size=16).hexdigest()
+        )
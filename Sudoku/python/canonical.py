@@ -0,0 +1,395 @@
+import hashlib
+import time
+
+from transform import Transform
+
+
+def canonical_form(
+    board: list[int], N: int, hgN: int, vgN: int, deadline: float | None = None
+) -> tuple[list[int], Transform] | None:
+    """
+    one board shared by all symmetric copies of board (see Transform.random), read
+    row by row with numbers relabeled in order of first appearance, and the
+    Transform that maps board onto it\n
+    symmetric puzzles get the same form; solutions of the form map back to board
+    through transform.inverse()\n
+    deadline: time.perf_counter() value, None is returned once it has passed
+    """
+    canonicalizer = _Canonicalizer(board, N, hgN, vgN, deadline)
+    try:
+        canonicalizer.run()
+    except _Expired:
+        return None
+    return canonicalizer.best, canonicalizer.transform
+
+
+def canonical_hash(board: list[int], N: int, hgN: int, vgN: int) -> str:
+    form, _ = canonical_form(board, N, hgN, vgN)
+    return hashlib.blake2b(
+        f"{N}x{N}:{hgN}x{vgN}:".encode() + bytes(form), digest_size=16
+    ).hexdigest()
+
+
+# kinds of colored vertices, index into the colors tuple
+_BANDS, _ROWS, _STACKS, _COLUMNS, _NUMBERS = range(5)
+_CHOICES = (_ROWS, _COLUMNS, _NUMBERS)
+
+
+class _Expired(Exception):
+    pass
+
+
+class _Canonicalizer:
+    """
+    individualization / refinement over bands, rows, stacks, columns and numbers:\n
+    colors are refined from what every row, column and number sees until they are
+    stable, so that rows / columns which read differently never tie; the ones that
+    still do are chosen one at a time (individualized) and refined again, down to
+    leaves that order every row and column\n
+    the form is the leaf with the smallest (trace, reading), the trace recording
+    how refinement went along the path, so a node whose trace is already larger
+    than the best one is cut; a leaf reading like the first is an automorphism,
+    used to skip the subtrees and the choices it maps onto explored ones
+    """
+
+    def __init__(
+        self, board: list[int], N: int, hgN: int, vgN: int, deadline: float | None
+    ):
+        self._board: list[int] = board
+        self._deadline: float | None = deadline
+        self._steps: int = 0
+        self._N: int = N
+        self._hgN: int = hgN
+        self._vgN: int = vgN
+        self._height: int = N // hgN
+        self._width: int = N // vgN
+        self._present: set[int] = set(board) - {0}
+        self._transposed: bool = False
+        self._lines: dict[int, list[list[int]]] = dict()
+        self._path: list[tuple[int, int]] = list()
+        self._trace: list[int] = list()
+        # of the current pass: the first leaf, its path and the automorphisms found
+        self._first: tuple[list[int], list[int], list[int]] | None = None
+        self._first_path: list[tuple[int, int]] = list()
+        self._automorphisms: list[dict[int, list[int]]] = list()
+        self._best_trace: list[int] | None = None
+        self.best: list[int] | None = None
+        self.transform: Transform | None = None
+
+    def run(self) -> None:
+        N = self._N
+        for transposed in (False, True) if self._hgN == self._vgN else (False,):
+            self._transposed = transposed
+            grid = [
+                [
+                    self._board[(col * N + row) if transposed else (row * N + col)]
+                    for col in range(N)
+                ]
+                for row in range(N)
+            ]
+            self._lines = {
+                _ROWS: grid,
+                _COLUMNS: [[row[col] for row in grid] for col in range(N)],
+            }
+            self._first = None
+            self._first_path = list()
+            self._automorphisms = list()
+            colors = (
+                [0 for _ in range(self._hgN)],
+                [0 for _ in range(N)],
+                [0 for _ in range(self._vgN)],
+                [0 for _ in range(N)],
+                [0] + [1 for _ in range(N)],
+            )
+            self.__search(colors, True)
+
+    def __search(self, colors: tuple[list[int], ...], tied: bool) -> int | None:
+        """
+        explores the node reached by self._path, tied while its trace is the best
+        one's so far; returns the depth to go back to when a leaf turned out to be
+        an automorphic image of the first one
+        """
+        self.__tick()
+        colors, invariant = self.__refine(colors)
+        depth = len(self._path)
+        if tied and self._best_trace is not None:
+            if depth >= len(self._best_trace) or invariant > self._best_trace[depth]:
+                return None
+            tied = invariant == self._best_trace[depth]
+        self._trace.append(invariant)
+        try:
+            if len(set(colors[_ROWS])) == self._N == len(set(colors[_COLUMNS])):
+                return self.__leaf(colors, tied)
+            kind, cell = self.__target(colors, depth)
+            explored: list[int] = list()
+            interchangeable: set[tuple[int, ...]] = set()
+            for vertex in cell:
+                key = self.__interchangeable(kind, vertex)
+                if key in interchangeable or (
+                    explored and self.__same_orbit(kind, vertex, explored)
+                ):
+                    continue
+                explored.append(vertex)
+                if key is not None:
+                    interchangeable.add(key)
+                individualized = list(colors)
+                individualized[kind] = _rank(
+                    [(color, idx != vertex) for idx, color in enumerate(colors[kind])]
+                )[0]
+                self._path.append((kind, vertex))
+                back = self.__search(tuple(individualized), tied)
+                self._path.pop()
+                if back is not None and back < depth:
+                    return back
+                # a new best leaf below makes this node's trace the best one's
+                tied = True
+            return None
+        finally:
+            self._trace.pop()
+
+    def __target(
+        self, colors: tuple[list[int], ...], depth: int
+    ) -> tuple[int, list[int]]:
+        """
+        the vertices of the smallest color shared by more than one row, column or
+        number on the board, taking turns between the three by depth
+        """
+        turn = depth % len(_CHOICES)
+        for kind in _CHOICES[turn:] + _CHOICES[:turn]:
+            cells: dict[int, list[int]] = dict()
+            for vertex, color in enumerate(colors[kind]):
+                if kind != _NUMBERS or vertex in self._present:
+                    cells.setdefault(color, list()).append(vertex)
+            for color in sorted(cells):
+                if len(cells[color]) > 1:
+                    return kind, cells[color]
+
+    def __refine(
+        self, colors: tuple[list[int], ...]
+    ) -> tuple[tuple[list[int], ...], int]:
+        """
+        splits each color by what its members see until no color splits; the
+        invariant hashes what was seen, the same for any symmetric copy
+        """
+        N, height, width = self._N, self._height, self._width
+        grid = self._lines[_ROWS]
+        bands, rows, stacks, columns, numbers = colors
+        count = sum(len(set(color)) for color in colors)
+        invariant = 0
+        while True:
+            self.__tick()
+            cells = [
+                [numbers[number] if number else -1 for number in line] for line in grid
+            ]
+            seen: list[list[tuple[int, int]]] = [list() for _ in numbers]
+            for row in range(N):
+                for col, number in enumerate(grid[row]):
+                    seen[number].append((rows[row], columns[col]))
+            keys = (
+                [
+                    (
+                        bands[band],
+                        tuple(sorted(rows[band * height : (band + 1) * height])),
+                    )
+                    for band in range(self._hgN)
+                ],
+                [
+                    (
+                        rows[row],
+                        bands[row // height],
+                        tuple(sorted(zip(columns, cells[row]))),
+                    )
+                    for row in range(N)
+                ],
+                [
+                    (
+                        stacks[stack],
+                        tuple(sorted(columns[stack * width : (stack + 1) * width])),
+                    )
+                    for stack in range(self._vgN)
+                ],
+                [
+                    (
+                        columns[col],
+                        stacks[col // width],
+                        tuple(sorted((rows[row], cells[row][col]) for row in range(N))),
+                    )
+                    for col in range(N)
+                ],
+                [
+                    (color, tuple(sorted(seen[number])))
+                    for number, color in enumerate(numbers)
+                ],
+            )
+            ranked = [_rank(key) for key in keys]
+            colors = tuple(color for color, _ in ranked)
+            invariant = hash((invariant, tuple(distinct for _, distinct in ranked)))
+            bands, rows, stacks, columns, numbers = colors
+            new_count = sum(len(distinct) for _, distinct in ranked)
+            if new_count == count:
+                return colors, invariant
+            count = new_count
+
+    def __leaf(self, colors: tuple[list[int], ...], tied: bool) -> int | None:
+        bands, rows, stacks, columns, _ = colors
+        row_order = sorted(
+            range(self._N), key=lambda row: (bands[row // self._height], rows[row])
+        )
+        column_order = sorted(
+            range(self._N), key=lambda col: (stacks[col // self._width], columns[col])
+        )
+        reading = self.__read(row_order, column_order)
+        if self._first is None:
+            self._first = (reading, row_order, column_order)
+            self._first_path = self._path.copy()
+        elif reading == self._first[0]:
+            return self.__automorphism(row_order, column_order)
+        if (
+            self.best is None
+            or not tied
+            or len(self._trace) < len(self._best_trace)
+            or reading < self.best
+        ):
+            self._best_trace = self._trace.copy()
+            self.best = reading
+            self.transform = self.__make_transform(row_order, column_order)
+        return None
+
+    def __automorphism(
+        self, row_order: list[int], column_order: list[int]
+    ) -> int | None:
+        """
+        records the automorphism mapping the first leaf onto this one; returns the
+        depth where the two paths part if it maps the first path's choice there
+        onto this path's, so that this whole subtree is an image of a seen one
+        """
+        _, first_rows, first_columns = self._first
+        grid = self._lines[_ROWS]
+        rows = [0 for _ in range(self._N)]
+        columns = [0 for _ in range(self._N)]
+        numbers = list(range(self._N + 1))
+        for first, row in zip(first_rows, row_order):
+            rows[first] = row
+        for first, col in zip(first_columns, column_order):
+            columns[first] = col
+        for row in range(self._N):
+            for col in range(self._N):
+                numbers[grid[row][col]] = grid[rows[row]][columns[col]]
+        automorphism = {_ROWS: rows, _COLUMNS: columns, _NUMBERS: numbers}
+        self._automorphisms.append(automorphism)
+        depth = 0
+        while (
+            depth < len(self._path)
+            and depth < len(self._first_path)
+            and self._path[depth] == self._first_path[depth]
+        ):
+            depth += 1
+        if depth == len(self._path) or depth == len(self._first_path):
+            return None
+        if any(
+            automorphism[kind][vertex] != vertex for kind, vertex in self._path[:depth]
+        ):
+            return None
+        kind, vertex = self._first_path[depth]
+        if (kind, automorphism[kind][vertex]) != self._path[depth]:
+            return None
+        return depth
+
+    def __interchangeable(self, kind: int, vertex: int) -> tuple[int, ...] | None:
+        """
+        empty rows swap with the empty rows of their band, and with those of other
+        bands holding neither a given nor a chosen row (columns alike), so a
+        single one of them is tried
+        """
+        if kind == _NUMBERS:
+            return None
+        lines = self._lines[kind]
+        if any(lines[vertex]):
+            return None
+        size = self._height if kind == _ROWS else self._width
+        group = vertex // size
+        chosen = {fixed for fixed_kind, fixed in self._path if fixed_kind == kind}
+        for idx in range(group * size, (group + 1) * size):
+            if idx in chosen or any(lines[idx]):
+                return (group,)
+        return ()
+
+    def __same_orbit(self, kind: int, vertex: int, explored: list[int]) -> bool:
+        """
+        whether an automorphism fixing the current path maps an explored choice
+        onto vertex
+        """
+        parent = list(range(self._N + 1))
+
+        def find(idx: int) -> int:
+            while parent[idx] != idx:
+                parent[idx] = parent[parent[idx]]
+                idx = parent[idx]
+            return idx
+
+        for automorphism in self._automorphisms:
+            if any(
+                automorphism[fixed_kind][fixed] != fixed
+                for fixed_kind, fixed in self._path
+            ):
+                continue
+            for idx, image in enumerate(automorphism[kind]):
+                parent[find(idx)] = find(image)
+        return any(find(idx) == find(vertex) for idx in explored)
+
+    def __read(self, row_order: list[int], column_order: list[int]) -> list[int]:
+        grid = self._lines[_ROWS]
+        labels: dict[int, int] = dict()
+        values = list()
+        for row in row_order:
+            for col in column_order:
+                number = grid[row][col]
+                if number and number not in labels:
+                    labels[number] = len(labels) + 1
+                values.append(labels.get(number, 0))
+        return values
+
+    def __tick(self) -> None:
+        """
+        raises _Expired past the deadline, looked at every 256 steps
+        """
+        self._steps += 1
+        if (
+            self._deadline is not None
+            and not self._steps & 255
+            and time.perf_counter() > self._deadline
+        ):
+            raise _Expired
+
+    def __make_transform(
+        self, row_order: list[int], column_order: list[int]
+    ) -> Transform:
+        N = self._N
+        cells = [
+            (col * N + row) if self._transposed else (row * N + col)
+            for row in row_order
+            for col in column_order
+        ]
+        labels: dict[int, int] = dict()
+        for cell in cells:
+            number = self._board[cell]
+            if number and number not in labels:
+                labels[number] = len(labels) + 1
+        numbers = [0 for _ in range(N + 1)]
+        label = len(labels)
+        for number in range(1, N + 1):
+            if number in labels:
+                numbers[number] = labels[number]
+            else:
+                label += 1
+                numbers[number] = label
+        return Transform(N, self._hgN, self._vgN, cells, numbers)
+
+
+def _rank(keys: list[tuple]) -> tuple[list[int], tuple]:
+    """
+    the rank of every key among the distinct keys, and the distinct keys
+    """
+    distinct = tuple(sorted(set(keys)))
+    rank = {key: idx for idx, key in enumerate(distinct)}
+    return [rank[key] for key in keys], distinct
@@ -0,0 +1,206 @@
+import argparse
+from itertools import batched, chain
+import json
+import os
+import statistics
+import sys
+import time
+from typing import IO, Iterator
+
+from batch import solve_many
+from corpus import format_board, read_puzzles
+import sudoku
+from sudoku import SudokuNxN, make_sudoku_class
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solves one puzzle per line from files or stdin, writing one "
+        'line per puzzle in input order: the solution, "unsolvable", "timeout" or '
+        '"invalid"'
+    )
+    parser.add_argument("inputs", nargs="*", default=["-"], help='files, "-" for stdin')
+    parser.add_argument(
+        "--type",
+        help='e.g. "9x9", "6x6h", "36x36" (default: square boxes, N from the first '
+        "puzzle)",
+    )
+    parser.add_argument(
+        "--box", help='"HGNxVGN" for any other shape, see make_sudoku_class()'
+    )
+    parser.add_argument(
+        "--delimiter", help='cell delimiter, " " for whitespace (default: compact)'
+    )
+    parser.add_argument("--skip", type=int, default=0, help="header lines per input")
+    parser.add_argument("--output", default="-", help='file, "-" for stdout')
+    parser.add_argument("--workers", type=int, help="processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument(
+        "--method",
+        default="minimum_case_first",
+        choices=["minimum_case_first", "brute_forcing", "dlx"],
+    )
+    parser.add_argument("--timeout", type=float, help="seconds per puzzle")
+    parser.add_argument("--no-optimize", action="store_true")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help='validate solved boards instead: "valid" or "invalid" per line',
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="JSON summary on stderr at the end"
+    )
+    args = parser.parse_args(argv)
+
+    puzzles = chain.from_iterable(
+        read_puzzles(path, delimiter=args.delimiter, skip=args.skip, strict=False)
+        for path in args.inputs
+    )
+    leading: list[None] = list()  # lines before the first puzzle that are not one
+    first = None
+    try:
+        for first in puzzles:
+            if first is not None:
+                break
+            leading.append(first)
+        if first is None and not leading:
+            return 0
+        # no line is a puzzle: every one is "invalid", whatever the class
+        cells = 81 if first is None else len(first)
+        sudoku_class = _sudoku_class(args.type, args.box, cells)
+    except Exception as error:
+        print(f"{sys.argv[0]}: {error}", file=sys.stderr)
+        return 1
+    puzzles = chain(leading, [] if first is None else [first], puzzles)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    counts = {"solved": 0, "unsolvable": 0, "timeout": 0, "invalid": 0}
+    if args.check:
+        counts = {"valid": 0, "invalid": 0}
+    latencies: list[float] = list()
+    error = None
+    start = time.perf_counter()
+    try:
+        if args.check:
+            _check(puzzles, sudoku_class(board=[0 for _ in range(cells)]), output, counts)
+        else:
+            _solve(puzzles, sudoku_class, args, output, counts, latencies)
+    except BrokenPipeError:  # the reader went away, like `| head`
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except Exception as exception:  # an input that cannot be read
+        error = exception
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+    elapsed = time.perf_counter() - start
+
+    if error is not None:
+        print(f"{sys.argv[0]}: {error}", file=sys.stderr)
+        return 1
+    if args.stats:
+        total = sum(counts.values())
+        json.dump(
+            {
+                **counts,
+                "puzzles": total,
+                "seconds": elapsed,
+                "puzzles_per_sec": total / elapsed if elapsed else None,
+                "latency": _latency(latencies),
+            },
+            sys.stderr,
+            indent=2,
+        )
+        print(file=sys.stderr)
+    return 0
+
+
+def _solve(
+    puzzles: Iterator[list[int] | None],
+    sudoku_class: type[SudokuNxN],
+    args: argparse.Namespace,
+    output: IO[str],
+    counts: dict[str, int],
+    latencies: list[float],
+) -> None:
+    for result in solve_many(
+        puzzles,
+        sudoku_class,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        method=args.method,
+        optimized=not args.no_optimize,
+        timeout=args.timeout,
+        detailed=True,
+    ):
+        if result is None:
+            counts["invalid"] += 1
+            output.write("invalid\n")
+            continue
+        counts[result.status] += 1
+        latencies.append(result.times["total"])
+        if result.solution is None:
+            output.write(f"{result.status}\n")
+        else:
+            output.write(format_board(result.solution, args.delimiter) + "\n")
+
+
+def _check(
+    puzzles: Iterator[list[int] | None],
+    sudoku: SudokuNxN,
+    output: IO[str],
+    counts: dict[str, int],
+) -> None:
+    """
+    complete, valid boards of the shape of sudoku, 4096 at a time; None (a line
+    that is not a puzzle) is invalid
+    """
+    for chunk in batched(puzzles, 4096):
+        boards = [board for board in chunk if board is not None]
+        valid = iter(sudoku._topology.validate(boards, complete=True))
+        for board in chunk:
+            status = "valid" if board is not None and next(valid) else "invalid"
+            counts[status] += 1
+            output.write(f"{status}\n")
+
+
+def _sudoku_class(
+    sudoku_type: str | None, box: str | None, cells: int
+) -> type[SudokuNxN]:
+    if box:
+        hgN, vgN = map(int, box.lower().split("x"))
+        sudoku_class = make_sudoku_class(hgN, vgN)
+    elif sudoku_type:
+        sudoku_class = getattr(sudoku, f"Sudoku{sudoku_type}", None)
+        if sudoku_class is None:
+            raise Exception(f"Unknown sudoku type: {sudoku_type}")
+    else:
+        side = round(cells**0.25)
+        if side**4 != cells:
+            raise Exception("Use --type or --box for boards without square boxes")
+        sudoku_class = make_sudoku_class(side, side)
+    return sudoku_class
+
+
+def _latency(latencies: list[float]) -> dict[str, float] | None:
+    """
+    seconds per solved / unsolvable / timed out puzzle
+    """
+    if not latencies:
+        return None
+    if len(latencies) == 1:
+        quantiles = latencies * 99
+    else:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "mean": statistics.fmean(latencies),
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "max": max(latencies),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import mmap
+import re
+import sys
+from typing import IO, Iterable, Iterator
+
+# compact format: one character per cell, "." or "0" for an empty cell
+SYMBOLS = "123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# the cells of a compact line end at the first separator, anything after it (a
+# rating, the solution of a "puzzle,solution" csv) is ignored
+_CELLS = re.compile(rb"[^\s,;|]*")
+
+# byte -> cell value of the compact format, 255 if it is not a cell; a table for
+# bytes.translate()
+_VALUE = bytearray(255 for _ in range(256))
+_VALUE[ord(".")] = _VALUE[ord("0")] = 0
+for _value, _symbol in enumerate(SYMBOLS, 1):
+    _VALUE[ord(_symbol)] = _VALUE[ord(_symbol.lower())] = _value
+_VALUE = bytes(_VALUE)
+
+
+def parse_line(
+    line: bytes, N: int | None = None, delimiter: str | None = None
+) -> list[int]:
+    """
+    one puzzle, row by row\n
+    delimiter None: compact format, N <= 35; otherwise numbers split by delimiter
+    (" " for any whitespace), 0 or "." for an empty cell\n
+    N is taken from the number of cells if not given
+    """
+    if delimiter is None:
+        cells = _CELLS.match(line.strip()).group()
+        if len(cells) != (N * N if N else _square(len(cells))):
+            raise Exception(f"Invalid puzzle: {line[:64]!r}")
+        values = cells.translate(_VALUE)
+        if 255 in values or (N and max(values) > N):
+            raise Exception(f"Invalid puzzle: {line[:64]!r}")
+        return list(values)
+    if delimiter == " ":
+        tokens = line.split()
+    else:
+        tokens = line.strip().split(delimiter.encode())
+    if N and len(tokens) != N * N or not N and _square(len(tokens)) is None:
+        raise Exception(f"Invalid puzzle: {line[:64]!r}")
+    return [int(token) if token not in (b".", b"") else 0 for token in tokens]
+
+
+def format_board(board: list[int], delimiter: str | None = None) -> str:
+    """
+    the line parse_line() reads back, "." for an empty cell in the compact format
+    """
+    if delimiter is None:
+        return "".join(SYMBOLS[cell - 1] if cell else "." for cell in board)
+    return delimiter.join(map(str, board))
+
+
+def iter_puzzles(
+    lines: Iterable[bytes],
+    N: int | None = None,
+    delimiter: str | None = None,
+    skip: int = 0,
+    strict: bool = True,
+) -> Iterator[list[int] | None]:
+    """
+    parse_line() of each line, after skip header lines; blank lines and lines
+    starting with "#" are left out\n
+    strict False: None for a line that is not a puzzle instead of raising
+    """
+    for number, line in enumerate(lines, 1):
+        if number <= skip:
+            continue
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        try:
+            puzzle = parse_line(line, N, delimiter)
+        except Exception as error:
+            if not strict:
+                yield None
+                continue
+            raise Exception(f"line {number}: {error}") from None
+        yield puzzle
+
+
+def read_puzzles(
+    path: str,
+    N: int | None = None,
+    delimiter: str | None = None,
+    skip: int = 0,
+    strict: bool = True,
+) -> Iterator[list[int] | None]:
+    """
+    iter_puzzles() over a memory-mapped file, so only the pages being parsed are
+    resident whatever the file size; "-" reads stdin instead
+    """
+    if path == "-":
+        yield from iter_puzzles(sys.stdin.buffer, N, delimiter, skip, strict)
+        return
+    with open(path, "rb") as file:
+        try:
+            view = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            return
+        with view:
+            yield from iter_puzzles(_lines(view), N, delimiter, skip, strict)
+
+
+def write_puzzles(
+    target: str | IO[str], boards: Iterable[list[int]], delimiter: str | None = None
+) -> int:
+    """
+    one format_board() line per board to a path ("-" for stdout) or an open text
+    file; returns how many boards were written
+    """
+    if isinstance(target, str):
+        if target == "-":
+            return write_puzzles(sys.stdout, boards, delimiter)
+        with open(target, "w", buffering=1 << 20) as file:
+            return write_puzzles(file, boards, delimiter)
+    count = 0
+    for board in boards:
+        target.write(format_board(board, delimiter))
+        target.write("\n")
+        count += 1
+    return count
+
+
+def _lines(view: mmap.mmap) -> Iterator[bytes]:
+    start = 0
+    size = len(view)
+    while start < size:
+        end = view.find(b"\n", start)
+        if end < 0:
+            end = size
+        yield view[start:end]
+        start = end + 1
+
+
+def _square(size: int) -> int | None:
+    """
+    N * N for a line of size cells, None if size is not a square
+    """
+    N = int(size**0.5 + 0.5)
+    return size if N * N == size and N else None
@@ -1,826 +0,0 @@
-"""
-All the data below is made from SudokuNxN.solve() of [[0 for _ in range(N)] for _ in range(N)] with random.seed(0).
-"""
-
-INIT_BOARD: dict[str, list[list[int]]] = {
-    "4x4": [
-        [1, 2, 3, 4],
-        [3, 4, 1, 2],
-        [2, 1, 4, 3],
-        [4, 3, 2, 1],
-    ],
-    "6x6h": [
-        [1, 2, 3, 4, 5, 6],
-        [4, 5, 6, 1, 2, 3],
-        [2, 3, 1, 5, 6, 4],
-        [5, 6, 4, 2, 3, 1],
-        [3, 1, 2, 6, 4, 5],
-        [6, 4, 5, 3, 1, 2],
-    ],
-    "6x6v": [
-        [1, 2, 3, 4, 5, 6],
-        [3, 4, 5, 6, 1, 2],
-        [5, 6, 1, 2, 3, 4],
-        [2, 1, 4, 3, 6, 5],
-        [4, 3, 6, 5, 2, 1],
-        [6, 5, 2, 1, 4, 3],
-    ],
-    "8x8h": [
-        [1, 2, 3, 4, 5, 6, 7, 8],
-        [5, 6, 7, 8, 1, 2, 3, 4],
-        [2, 4, 1, 3, 6, 7, 8, 5],
-        [6, 8, 5, 7, 2, 4, 1, 3],
-        [3, 1, 6, 2, 8, 5, 4, 7],
-        [4, 7, 8, 5, 3, 1, 2, 6],
-        [7, 3, 2, 6, 4, 8, 5, 1],
-        [8, 5, 4, 1, 7, 3, 6, 2],
-    ],
-    "8x8v": [
-        [1, 2, 3, 4, 5, 6, 7, 8],
-        [3, 4, 7, 8, 1, 2, 5, 6],
-        [5, 6, 1, 2, 7, 8, 3, 4],
-        [7, 8, 5, 6, 3, 4, 1, 2],
-        [2, 1, 4, 3, 6, 5, 8, 7],
-        [4, 3, 8, 7, 2, 1, 6, 5],
-        [6, 5, 2, 1, 8, 7, 4, 3],
-        [8, 7, 6, 5, 4, 3, 2, 1],
-    ],
-    "9x9": [
-        [1, 2, 3, 4, 5, 6, 7, 8, 9],
-        [4, 5, 6, 7, 8, 9, 1, 2, 3],
-        [7, 8, 9, 1, 2, 3, 4, 5, 6],
-        [2, 3, 1, 6, 7, 4, 8, 9, 5],
-        [8, 7, 5, 9, 1, 2, 3, 6, 4],
-        [6, 9, 4, 5, 3, 8, 2, 1, 7],
-        [3, 1, 7, 2, 6, 5, 9, 4, 8],
-        [5, 4, 2, 8, 9, 7, 6, 3, 1],
-        [9, 6, 8, 3, 4, 1, 5, 7, 2],
-    ],
-    "12x12h": [
-        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-        [5, 6, 7, 8, 9, 10, 11, 12, 1, 2, 3, 4],
-        [9, 10, 11, 12, 1, 2, 3, 4, 5, 6, 7, 8],
-        [2, 7, 1, 3, 10, 9, 4, 5, 11, 12, 8, 6],
-        [10, 11, 12, 5, 7, 8, 2, 6, 3, 1, 4, 9],
-        [4, 8, 9, 6, 11, 12, 1, 3, 7, 5, 2, 10],
-        [3, 1, 6, 10, 2, 4, 9, 11, 8, 7, 12, 5],
-        [12, 5, 4, 7, 8, 3, 10, 1, 6, 11, 9, 2],
-        [8, 9, 2, 11, 6, 5, 12, 7, 4, 3, 10, 1],
-        [6, 3, 8, 2, 12, 7, 5, 9, 10, 4, 1, 11],
-        [7, 12, 5, 1, 4, 11, 8, 10, 2, 9, 6, 3],
-        [11, 4, 10, 9, 3, 1, 6, 2, 12, 8, 5, 7],
-    ],
-    "12x12v": [
-        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-        [4, 5, 6, 10, 11, 12, 1, 2, 3, 7, 8, 9],
-        [7, 8, 9, 1, 2, 3, 10, 11, 12, 4, 5, 6],
-        [10, 11, 12, 7, 8, 9, 4, 5, 6, 1, 2, 3],
-        [2, 3, 1, 8, 6, 4, 11, 9, 5, 12, 10, 7],
-        [9, 10, 7, 11, 3, 1, 2, 12, 8, 6, 4, 5],
-        [6, 12, 8, 5, 9, 7, 3, 4, 10, 11, 1, 2],
-        [5, 4, 11, 12, 10, 2, 6, 1, 7, 9, 3, 8],
-        [3, 6, 4, 2, 7, 8, 9, 10, 1, 5, 12, 11],
-        [8, 1, 2, 6, 12, 10, 5, 7, 11, 3, 9, 4],
-        [11, 7, 10, 9, 4, 5, 12, 3, 2, 8, 6, 1],
-        [12, 9, 5, 3, 1, 11, 8, 6, 4, 2, 7, 10],
-    ],
-    "16x16": [
-        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
-        [5, 6, 7, 8, 13, 14, 15, 16, 1, 2, 3, 4, 9, 10, 11, 12],
-        [9, 10, 11, 12, 1, 2, 3, 4, 13, 14, 15, 16, 5, 6, 7, 8],
-        [13, 14, 15, 16, 9, 10, 11, 12, 5, 6, 7, 8, 1, 2, 3, 4],
-        [2, 4, 1, 3, 8, 9, 10, 5, 14, 11, 12, 6, 16, 15, 13, 7],
-        [15, 11, 12, 14, 16, 4, 1, 6, 2, 13, 5, 7, 8, 3, 9, 10],
-        [7, 13, 16, 9, 14, 11, 2, 15, 8, 3, 10, 1, 6, 4, 12, 5],
-        [8, 5, 10, 6, 3, 7, 12, 13, 15, 16, 4, 9, 11, 1, 2, 14],
-        [3, 1, 8, 2, 6, 5, 9, 7, 11, 4, 16, 13, 10, 12, 14, 15],
-        [12, 7, 4, 13, 11, 15, 14, 1, 3, 9, 8, 10, 2, 16, 5, 6],
-        [14, 16, 9, 10, 4, 12, 13, 2, 6, 5, 1, 15, 3, 7, 8, 11],
-        [6, 15, 5, 11, 10, 8, 16, 3, 7, 12, 2, 14, 4, 9, 1, 13],
-        [4, 8, 6, 1, 12, 3, 5, 11, 10, 7, 14, 2, 15, 13, 16, 9],
-        [10, 3, 13, 15, 7, 16, 8, 9, 12, 1, 6, 5, 14, 11, 4, 2],
-        [11, 12, 14, 5, 2, 13, 4, 10, 16, 15, 9, 3, 7, 8, 6, 1],
-        [16, 9, 2, 7, 15, 1, 6, 14, 4, 8, 13, 11, 12, 5, 10, 3],
-    ],
-    "20x20h": [
-        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20],
-        [6, 7, 8, 9, 10, 16, 17, 18, 19, 20, 1, 2, 3, 4, 5, 11, 12, 13, 14, 15],
-        [11, 12, 13, 14, 15, 1, 2, 3, 4, 5, 16, 17, 18, 19, 20, 6, 7, 8, 9, 10],
-        [16, 17, 18, 19, 20, 11, 12, 13, 14, 15, 6, 7, 8, 9, 10, 1, 2, 3, 4, 5],
-        [2, 9, 1, 3, 4, 12, 13, 16, 5, 6, 18, 14, 17, 10, 7, 20, 15, 19, 11, 8],
-        [17, 18, 19, 16, 6, 20, 8, 11, 2, 7, 12, 15, 4, 13, 3, 9, 1, 5, 10, 14],
-        [14, 20, 10, 13, 7, 15, 19, 9, 1, 18, 5, 16, 11, 6, 8, 4, 3, 2, 12, 17],
-        [5, 11, 12, 15, 8, 10, 4, 17, 3, 14, 2, 19, 20, 1, 9, 7, 13, 6, 16, 18],
-        [3, 1, 11, 10, 2, 9, 14, 5, 13, 4, 20, 8, 12, 17, 18, 19, 16, 15, 7, 6],
-        [19, 13, 16, 6, 18, 2, 15, 10, 20, 8, 7, 4, 9, 3, 11, 12, 14, 17, 5, 1],
-        [15, 4, 20, 7, 9, 3, 11, 6, 12, 17, 14, 1, 16, 5, 19, 8, 18, 10, 13, 2],
-        [8, 5, 14, 12, 17, 7, 16, 1, 18, 19, 13, 10, 15, 2, 6, 3, 4, 9, 20, 11],
-        [4, 15, 2, 8, 13, 14, 6, 7, 16, 3, 19, 5, 1, 20, 12, 17, 10, 11, 18, 9],
-        [12, 16, 5, 17, 19, 13, 20, 15, 10, 9, 3, 11, 6, 18, 4, 2, 8, 14, 1, 7],
-        [18, 10, 6, 20, 11, 19, 1, 12, 17, 2, 15, 9, 7, 8, 14, 13, 5, 16, 3, 4],
-        [9, 3, 7, 1, 14, 5, 18, 4, 8, 11, 10, 13, 2, 16, 17, 15, 19, 20, 6, 12],
-        [7, 8, 15, 2, 12, 4, 5, 14, 6, 13, 9, 3, 10, 11, 16, 18, 20, 1, 17, 19],
-        [10, 14, 9, 18, 1, 8, 3, 2, 11, 12, 17, 20, 19, 7, 13, 5, 6, 4, 15, 16],
-        [13, 19, 17, 5, 16, 18, 9, 20, 7, 1, 4, 6, 14, 15, 2, 10, 11, 12, 8, 3],
-        [20, 6, 4, 11, 3, 17, 10, 19, 15, 16, 8, 18, 5, 12, 1, 14, 9, 7, 2, 13],
-    ],
-    "20x20v": [
-        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20],
-        [5, 6, 7, 8, 17, 18, 19, 20, 1, 2, 3, 4, 9, 10, 11, 12, 13, 14, 15, 16],
-        [9, 10, 11, 12, 1, 2, 3, 4, 13, 14, 15, 16, 17, 18, 19, 20, 5, 6, 7, 8],
-        [13, 14, 15, 16, 9, 10, 11, 12, 17, 18, 19, 20, 5, 6, 7, 8, 1, 2, 3, 4],
-        [17, 18, 19, 20, 13, 14, 15, 16, 5, 6, 7, 8, 1, 2, 3, 4, 9, 10, 11, 12],
-        [2, 4, 1, 3, 11, 8, 10, 5, 15, 16, 12, 6, 18, 17, 13, 7, 19, 20, 14, 9],
-        [18, 15, 17, 14, 19, 20, 4, 7, 2, 3, 5, 13, 16, 9, 6, 1, 10, 12, 8, 11],
-        [16, 11, 8, 5, 6, 9, 12, 14, 19, 17, 10, 18, 15, 20, 2, 3, 4, 7, 1, 13],
-        [10, 13, 12, 9, 2, 1, 17, 18, 20, 4, 8, 7, 14, 11, 5, 19, 6, 3, 16, 15],
-        [19, 20, 6, 7, 3, 16, 13, 15, 11, 1, 9, 14, 4, 8, 12, 10, 2, 5, 17, 18],
-        [3, 1, 13, 15, 16, 11, 8, 2, 4, 9, 17, 5, 7, 12, 20, 14, 18, 19, 10, 6],
-        [7, 16, 10, 2, 15, 17, 5, 9, 12, 19, 14, 1, 6, 13, 8, 18, 20, 11, 4, 3],
-        [8, 17, 14, 6, 12, 13, 1, 3, 7, 20, 18, 2, 10, 19, 4, 11, 15, 16, 9, 5],
-        [4, 5, 9, 18, 10, 7, 20, 19, 6, 11, 13, 3, 2, 1, 16, 15, 8, 17, 12, 14],
-        [11, 12, 20, 19, 14, 4, 18, 6, 8, 15, 16, 10, 3, 5, 9, 17, 7, 13, 2, 1],
-        [6, 3, 4, 13, 7, 15, 2, 17, 14, 12, 1, 9, 19, 16, 18, 5, 11, 8, 20, 10],
-        [12, 9, 16, 11, 4, 3, 6, 13, 10, 5, 20, 17, 8, 7, 1, 2, 14, 15, 18, 19],
-        [14, 19, 5, 1, 8, 12, 9, 11, 18, 7, 2, 15, 20, 3, 10, 6, 16, 4, 13, 17],
-        [15, 7, 18, 10, 20, 19, 14, 1, 16, 8, 6, 11, 12, 4, 17, 13, 3, 9, 5, 2],
-        [20, 8, 2, 17, 18, 5, 16, 10, 3, 13, 4, 19, 11, 15, 14, 9, 12, 1, 6, 7],
-    ],
-    "25x25": [
-        [
-            1,
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-        ],
-        [
-            6,
-            7,
-            8,
-            9,
-            10,
-            21,
-            22,
-            23,
-            24,
-            25,
-            1,
-            2,
-            3,
-            4,
-            5,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-        ],
-        [
-            11,
-            12,
-            13,
-            14,
-            15,
-            1,
-            2,
-            3,
-            4,
-            5,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            6,
-            7,
-            8,
-            9,
-            10,
-        ],
-        [
-            16,
-            17,
-            18,
-            19,
-            20,
-            11,
-            12,
-            13,
-            14,
-            15,
-            21,
-            22,
-            23,
-            24,
-            25,
-            6,
-            7,
-            8,
-            9,
-            10,
-            1,
-            2,
-            3,
-            4,
-            5,
-        ],
-        [
-            21,
-            22,
-            23,
-            24,
-            25,
-            16,
-            17,
-            18,
-            19,
-            20,
-            6,
-            7,
-            8,
-            9,
-            10,
-            1,
-            2,
-            3,
-            4,
-            5,
-            11,
-            12,
-            13,
-            14,
-            15,
-        ],
-        [
-            2,
-            5,
-            1,
-            3,
-            4,
-            10,
-            11,
-            12,
-            13,
-            6,
-            18,
-            21,
-            14,
-            15,
-            7,
-            22,
-            23,
-            19,
-            16,
-            8,
-            25,
-            24,
-            20,
-            17,
-            9,
-        ],
-        [
-            17,
-            20,
-            21,
-            22,
-            23,
-            24,
-            14,
-            5,
-            1,
-            7,
-            25,
-            3,
-            6,
-            8,
-            9,
-            12,
-            13,
-            11,
-            15,
-            2,
-            10,
-            16,
-            4,
-            18,
-            19,
-        ],
-        [
-            10,
-            16,
-            19,
-            6,
-            9,
-            15,
-            23,
-            21,
-            25,
-            4,
-            22,
-            13,
-            12,
-            20,
-            24,
-            14,
-            18,
-            17,
-            1,
-            3,
-            7,
-            5,
-            2,
-            8,
-            11,
-        ],
-        [
-            24,
-            25,
-            14,
-            12,
-            18,
-            2,
-            8,
-            17,
-            16,
-            22,
-            4,
-            19,
-            11,
-            10,
-            23,
-            7,
-            9,
-            20,
-            5,
-            6,
-            3,
-            13,
-            1,
-            15,
-            21,
-        ],
-        [
-            8,
-            15,
-            7,
-            11,
-            13,
-            19,
-            20,
-            9,
-            3,
-            18,
-            2,
-            1,
-            5,
-            17,
-            16,
-            24,
-            10,
-            21,
-            25,
-            4,
-            12,
-            14,
-            6,
-            22,
-            23,
-        ],
-        [
-            3,
-            1,
-            15,
-            16,
-            2,
-            14,
-            9,
-            19,
-            17,
-            8,
-            13,
-            20,
-            22,
-            21,
-            4,
-            10,
-            5,
-            7,
-            18,
-            23,
-            24,
-            11,
-            25,
-            12,
-            6,
-        ],
-        [
-            22,
-            23,
-            24,
-            20,
-            19,
-            4,
-            5,
-            6,
-            12,
-            1,
-            15,
-            18,
-            16,
-            11,
-            3,
-            25,
-            14,
-            2,
-            8,
-            13,
-            9,
-            10,
-            21,
-            7,
-            17,
-        ],
-        [
-            25,
-            4,
-            17,
-            8,
-            12,
-            13,
-            16,
-            7,
-            18,
-            2,
-            14,
-            9,
-            10,
-            5,
-            6,
-            15,
-            24,
-            22,
-            11,
-            21,
-            20,
-            23,
-            19,
-            1,
-            3,
-        ],
-        [
-            13,
-            14,
-            5,
-            21,
-            11,
-            22,
-            24,
-            10,
-            20,
-            3,
-            7,
-            23,
-            25,
-            1,
-            19,
-            17,
-            4,
-            9,
-            6,
-            12,
-            2,
-            8,
-            15,
-            16,
-            18,
-        ],
-        [
-            7,
-            10,
-            9,
-            18,
-            6,
-            23,
-            25,
-            15,
-            21,
-            11,
-            24,
-            8,
-            17,
-            2,
-            12,
-            19,
-            20,
-            1,
-            3,
-            16,
-            13,
-            4,
-            14,
-            5,
-            22,
-        ],
-        [
-            4,
-            11,
-            2,
-            5,
-            14,
-            9,
-            13,
-            1,
-            6,
-            21,
-            12,
-            10,
-            7,
-            23,
-            17,
-            3,
-            19,
-            15,
-            20,
-            24,
-            22,
-            18,
-            16,
-            25,
-            8,
-        ],
-        [
-            9,
-            13,
-            10,
-            7,
-            22,
-            18,
-            3,
-            14,
-            2,
-            23,
-            5,
-            15,
-            20,
-            16,
-            1,
-            4,
-            8,
-            25,
-            21,
-            17,
-            19,
-            6,
-            12,
-            11,
-            24,
-        ],
-        [
-            15,
-            19,
-            16,
-            25,
-            24,
-            8,
-            4,
-            20,
-            22,
-            17,
-            3,
-            11,
-            21,
-            6,
-            2,
-            18,
-            1,
-            10,
-            12,
-            14,
-            23,
-            9,
-            5,
-            13,
-            7,
-        ],
-        [
-            18,
-            3,
-            6,
-            23,
-            1,
-            12,
-            10,
-            16,
-            7,
-            19,
-            8,
-            25,
-            24,
-            13,
-            14,
-            2,
-            11,
-            5,
-            22,
-            9,
-            15,
-            20,
-            17,
-            21,
-            4,
-        ],
-        [
-            12,
-            8,
-            20,
-            17,
-            21,
-            5,
-            15,
-            25,
-            11,
-            24,
-            9,
-            4,
-            19,
-            18,
-            22,
-            13,
-            6,
-            16,
-            23,
-            7,
-            14,
-            1,
-            10,
-            3,
-            2,
-        ],
-        [
-            5,
-            6,
-            22,
-            10,
-            3,
-            17,
-            18,
-            2,
-            8,
-            13,
-            20,
-            14,
-            1,
-            25,
-            11,
-            9,
-            15,
-            12,
-            7,
-            19,
-            4,
-            21,
-            24,
-            23,
-            16,
-        ],
-        [
-            14,
-            18,
-            4,
-            1,
-            8,
-            20,
-            19,
-            22,
-            15,
-            9,
-            17,
-            24,
-            2,
-            3,
-            21,
-            23,
-            16,
-            6,
-            13,
-            11,
-            5,
-            25,
-            7,
-            10,
-            12,
-        ],
-        [
-            19,
-            9,
-            11,
-            13,
-            16,
-            25,
-            1,
-            4,
-            23,
-            12,
-            10,
-            6,
-            15,
-            7,
-            8,
-            5,
-            21,
-            24,
-            2,
-            18,
-            17,
-            3,
-            22,
-            20,
-            14,
-        ],
-        [
-            20,
-            21,
-            25,
-            15,
-            17,
-            7,
-            6,
-            24,
-            5,
-            14,
-            23,
-            16,
-            9,
-            12,
-            13,
-            8,
-            3,
-            4,
-            10,
-            22,
-            18,
-            19,
-            11,
-            2,
-            1,
-        ],
-        [
-            23,
-            24,
-            12,
-            2,
-            7,
-            3,
-            21,
-            11,
-            10,
-            16,
-            19,
-            5,
-            4,
-            22,
-            18,
-            20,
-            25,
-            14,
-            17,
-            1,
-            8,
-            15,
-            9,
-            6,
-            13,
-        ],
-    ],
-}
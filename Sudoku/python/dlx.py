@@ -0,0 +1,138 @@
+import time
+from typing import Hashable, Iterable, Iterator
+
+
+class DancingLinks:
+    """
+    Knuth's Algorithm X on a toroidal doubly linked matrix.\n
+    Node 0 is the root, nodes 1..len(columns) are column headers.\n
+    """
+
+    def __init__(self, columns: Iterable[Hashable]):
+        self._column_id: dict[Hashable, int] = dict()
+        self._L: list[int] = [0]
+        self._R: list[int] = [0]
+        self._U: list[int] = [0]
+        self._D: list[int] = [0]
+        self._C: list[int] = [0]
+        self._S: list[int] = [0]
+        self._row: list[Hashable] = [None]
+        self.nodes: int = 0
+        self.backtracks: int = 0
+        self.max_depth: int = 0
+        self.timed_out: bool = False
+        for column in columns:
+            node = len(self._L)
+            self._column_id[column] = node
+            self._L.append(node - 1)
+            self._R.append(0)
+            self._R[node - 1] = node
+            self._L[0] = node
+            self._U.append(node)
+            self._D.append(node)
+            self._C.append(node)
+            self._S.append(0)
+            self._row.append(None)
+
+    def add_row(self, row: Hashable, columns: Iterable[Hashable]) -> "DancingLinks":
+        first = None
+        for column in columns:
+            header = self._column_id[column]
+            node = len(self._L)
+            self._U.append(self._U[header])
+            self._D.append(header)
+            self._D[self._U[header]] = node
+            self._U[header] = node
+            self._C.append(header)
+            self._S[header] += 1
+            self._row.append(row)
+            if first is None:
+                first = node
+                self._L.append(node)
+                self._R.append(node)
+            else:
+                self._L.append(self._L[first])
+                self._R.append(first)
+                self._R[self._L[first]] = node
+                self._L[first] = node
+        return self
+
+    def solutions(self, deadline: float | None = None) -> Iterator[list[Hashable]]:
+        """
+        yields every exact cover as a list of row keys\n
+        iterative, so the depth is not bounded by the recursion limit\n
+        deadline: time.perf_counter() value after which it stops with timed_out set
+        (checked at every node)
+        """
+        L, R, D, C, S = self._L, self._R, self._D, self._C, self._S
+        stack: list[int] = []
+        while True:
+            if R[0] == 0:
+                yield [self._row[node] for node in stack]
+                node = None
+            else:
+                column, size = 0, -1
+                header = R[0]
+                while header:
+                    if size < 0 or S[header] < size:
+                        column, size = header, S[header]
+                        if size < 2:
+                            break
+                    header = R[header]
+                if size == 0:
+                    node = None
+                else:
+                    self.__cover(column)
+                    node = D[column]
+            while node is None:
+                if not stack:
+                    return
+                node = stack.pop()
+                self.backtracks += 1
+                left = L[node]
+                while left != node:
+                    self.__uncover(C[left])
+                    left = L[left]
+                node = D[node]
+                if node == C[node]:
+                    self.__uncover(node)
+                    node = None
+            stack.append(node)
+            self.nodes += 1
+            if len(stack) > self.max_depth:
+                self.max_depth = len(stack)
+            if deadline is not None and time.perf_counter() > deadline:
+                self.timed_out = True
+                return
+            right = R[node]
+            while right != node:
+                self.__cover(C[right])
+                right = R[right]
+
+    def __cover(self, column: int) -> None:
+        L, R, U, D, C, S = self._L, self._R, self._U, self._D, self._C, self._S
+        R[L[column]] = R[column]
+        L[R[column]] = L[column]
+        node = D[column]
+        while node != column:
+            right = R[node]
+            while right != node:
+                U[D[right]] = U[right]
+                D[U[right]] = D[right]
+                S[C[right]] -= 1
+                right = R[right]
+            node = D[node]
+
+    def __uncover(self, column: int) -> None:
+        L, R, U, D, C, S = self._L, self._R, self._U, self._D, self._C, self._S
+        node = U[column]
+        while node != column:
+            left = L[node]
+            while left != node:
+                S[C[left]] += 1
+                U[D[left]] = left
+                D[U[left]] = left
+                left = L[left]
+            node = U[node]
+        R[L[column]] = column
+        L[R[column]] = column
@@ -0,0 +1,122 @@
+import random
+
+from search import Search
+from sudoku import Sudoku9x9, SudokuBase
+from vars import DIFFICULTY
+
+RULES = ("hidden single", "locked candidates", "naked subset", "hidden subset", "fish")
+
+
+def generate(
+    sudoku_class: type[SudokuBase] = Sudoku9x9,
+    clues: int | None = None,
+    difficulty: DIFFICULTY | None = None,
+    attempts: int = 100,
+) -> list[int]:
+    """
+    returns a puzzle with a unique solution\n
+    clues: stop removing once the puzzle has this many clues
+    (a minimal puzzle may keep more, then another grid is tried)\n
+    difficulty: see grade()
+    """
+    for _ in range(attempts):
+        puzzle = _carve(sudoku_class, clues, difficulty)
+        if clues is not None and len(puzzle) - puzzle.count(0) > clues:
+            continue
+        if difficulty is not None and grade(puzzle, sudoku_class) != difficulty:
+            continue
+        return puzzle
+    raise Exception("No puzzle found for the given clues and difficulty")
+
+
+def grade(board: list[int], sudoku_class: type[SudokuBase] = Sudoku9x9) -> DIFFICULTY:
+    """
+    easy: naked singles only\n
+    medium: naked and hidden singles\n
+    hard: every deduction rule, without guessing\n
+    expert: needs branching
+    """
+    sudoku = sudoku_class(board=board)
+    for difficulty in ("easy", "medium", "hard"):
+        _configure(sudoku, difficulty)
+        sudoku._reset()
+        if sudoku._propagate() and 0 not in sudoku._board:
+            return difficulty
+    return "expert"
+
+
+def _configure(sudoku: SudokuBase, difficulty: DIFFICULTY | None) -> None:
+    """
+    the rules of the band; "expert" and None keep the default rules for the search
+    """
+    sudoku.optimize(difficulty != "easy")
+    if difficulty == "medium":
+        for rule in RULES:
+            sudoku.enable_rule(rule, rule == "hidden single")
+    elif difficulty == "hard":
+        for rule in RULES:
+            sudoku.enable_rule(rule)
+
+
+def _carve(
+    sudoku_class: type[SudokuBase], clues: int | None, difficulty: DIFFICULTY | None
+) -> list[int]:
+    """
+    removes the clues of a random full grid one at a time in random order,
+    keeping a clue if removing it breaks uniqueness (or, below "expert", leaves a
+    puzzle the band's rules cannot finish without guessing)\n
+    the clues are put and propagated on one instance in reverse removal order, so
+    testing a cell only undoes the trail down to it and puts back the clues kept
+    since; propagation then only goes on from the cells those clues change
+    """
+    sudoku = sudoku_class()
+    sudoku.optimize().solve(backend="python")
+    solution = sudoku._board.tolist()
+
+    sudoku = sudoku_class(board=[0 for _ in solution])
+    _configure(sudoku, difficulty)
+    sudoku._reset()
+    order = random.sample(range(len(solution)), len(solution))
+    mark: dict[int, int] = dict()
+    for idx in reversed(order):
+        mark[idx] = len(sudoku._trail)
+        sudoku.put(idx, solution[idx])
+        sudoku._propagate()
+
+    puzzle = solution.copy()
+    kept: list[int] = list()
+    remaining = len(solution)
+    for idx in order:
+        if clues is not None and remaining <= clues:
+            break
+        sudoku._undo(mark[idx])
+        for cell in kept:
+            sudoku.put(cell, solution[cell])
+        if _removable(sudoku, idx, solution, difficulty):
+            puzzle[idx] = 0
+            remaining -= 1
+        else:
+            kept.append(idx)
+    return puzzle
+
+
+def _removable(
+    sudoku: SudokuBase, idx: int, solution: list[int], difficulty: DIFFICULTY | None
+) -> bool:
+    """
+    sudoku holds the propagated clues after idx in removal order plus the clues
+    put back since, whose changes are still queued in sudoku._dirty\n
+    the search for another solution tries the numbers of solution first, another
+    solution mostly differs from it in a few cells
+    """
+    mark = len(sudoku._trail)
+    if difficulty in ("easy", "medium", "hard"):
+        removable = sudoku._propagate() and 0 not in sudoku._board
+    elif sudoku._board[idx]:  # forced by the other clues
+        removable = True
+    else:
+        sudoku._eliminate(idx, 1 << (solution[idx] - 1))
+        removable = not Search(sudoku, prefer=solution).run()
+    sudoku._undo(mark)
+    sudoku._dirty.clear()
+    return removable
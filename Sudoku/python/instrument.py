@@ -0,0 +1,66 @@
+class Instrumentation:
+    """
+    Counters and time.perf_counter_ns() timers fed by Search, see
+    SudokuBase.instrument().\n
+    Subclass it and override the hooks for callbacks; call super() to keep the
+    counters. Search only looks at it when one is set.\n
+    """
+
+    def __init__(self):
+        self.nodes: int = 0
+        self.propagations: int = 0
+        self.branches: int = 0
+        self.undos: int = 0
+        self.dead_ends: int = 0
+        self.propagate_ns: int = 0
+        self.candidates_ns: int = 0
+        self.undo_ns: int = 0
+
+    def node(self, depth: int) -> None:
+        """
+        a node is entered, depth decisions below the root
+        """
+        self.nodes += 1
+
+    def propagate(self, consistent: bool, ns: int) -> None:
+        """
+        SudokuBase._propagate() ran for ns, consistent is what it returned
+        """
+        self.propagations += 1
+        self.propagate_ns += ns
+
+    def branch(self, idx: int, numbers: list[int], ns: int) -> None:
+        """
+        the search branches on cell idx over numbers, choosing them took ns
+        """
+        self.branches += 1
+        self.candidates_ns += ns
+
+    def undo(self, mark: int, ns: int) -> None:
+        """
+        the trail was undone down to mark in ns
+        """
+        self.undos += 1
+        self.undo_ns += ns
+
+    def dead_end(self, depth: int) -> None:
+        """
+        propagation hit a contradiction depth decisions below the root
+        """
+        self.dead_ends += 1
+
+    def reset(self) -> "Instrumentation":
+        self.__init__()
+        return self
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "nodes": self.nodes,
+            "propagations": self.propagations,
+            "branches": self.branches,
+            "undos": self.undos,
+            "dead_ends": self.dead_ends,
+            "propagate_ns": self.propagate_ns,
+            "candidates_ns": self.candidates_ns,
+            "undo_ns": self.undo_ns,
+        }
@@ -0,0 +1,54 @@
+from vars import STATUS
+
+
+class SolveResult:
+    """
+    what SudokuBase.solve() found and what it took\n
+    solution: the full board when solved, otherwise None\n
+    nodes / backtracks / max_depth: of the search (DLX: column choices)\n
+    propagations: deductions of constraint propagation, cells filled by singles
+    plus cells the rules narrowed (DLX does not propagate)\n
+    times: wall time per phase in seconds ("reset", "cache", "search", "propagate"
+    (part of "search"), "total")\n
+    truthy only when solved, so `if sudoku.solve():` keeps working
+    """
+
+    def __init__(self, method: str, backend: str):
+        self.status: STATUS = "unsolvable"
+        self.solution: list[int] | None = None
+        self.method: str = method
+        self.backend: str = backend
+        self.cached: bool = False
+        self.nodes: int = 0
+        self.backtracks: int = 0
+        self.propagations: int = 0
+        self.max_depth: int = 0
+        self.times: dict[str, float] = dict()
+
+    @property
+    def solved(self) -> bool:
+        return self.status == "solved"
+
+    def stats(self) -> dict[str, str | bool | int | float | dict[str, float]]:
+        return {
+            "status": self.status,
+            "method": self.method,
+            "backend": self.backend,
+            "cached": self.cached,
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "propagations": self.propagations,
+            "max_depth": self.max_depth,
+            "times": self.times.copy(),
+        }
+
+    def __bool__(self) -> bool:
+        return self.solved
+
+    def __str__(self) -> str:
+        return (
+            f"{self.status} ({self.method}, {self.backend}): "
+            f"{self.nodes} nodes, {self.backtracks} backtracks, "
+            f"{self.propagations} propagations, max depth {self.max_depth}, "
+            f"{self.times.get('total', 0.0):.3f}sec"
+        )
@@ -0,0 +1,230 @@
+from abc import ABCMeta, abstractmethod
+from itertools import combinations
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sudoku import Group, SudokuBase
+
+
+class Rule(metaclass=ABCMeta):
+    """
+    A deduction run by SudokuBase._propagate() once no naked single is left.\n
+    apply() gets the groups whose candidates changed since the rule last ran and
+    returns how many cells it filled or narrowed, or None on a contradiction.\n
+    """
+
+    name: str = ""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled: bool = enabled
+        self.calls: int = 0
+        self.hits: int = 0
+        self.time: float = 0.0
+
+    def __call__(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        start = time.perf_counter()
+        result = self.apply(sudoku, groups)
+        self.time += time.perf_counter() - start
+        self.calls += 1
+        if result:
+            self.hits += result
+        return result
+
+    def reset(self) -> "Rule":
+        self.calls = 0
+        self.hits = 0
+        self.time = 0.0
+        return self
+
+    @abstractmethod
+    def apply(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        pass
+
+
+class HiddenSingle(Rule):
+    """
+    a number that fits in only one cell of a group goes there
+    """
+
+    name = "hidden single"
+
+    def apply(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        positions = sudoku._positions
+        hits = 0
+        for group in groups:
+            numbers = group.available
+            while numbers:
+                number = (numbers & -numbers).bit_length() - 1
+                numbers &= numbers - 1
+                where = positions[number] & group.mask
+                if not where:
+                    return None
+                if not where & (where - 1):
+                    hits += sudoku.put(where.bit_length() - 1, number + 1)
+        return hits
+
+
+class NakedSubset(Rule):
+    """
+    k cells of a group sharing only k numbers remove them from the rest of it
+    """
+
+    name = "naked subset"
+
+    def __init__(self, enabled: bool = True, max_size: int = 3):
+        super().__init__(enabled)
+        self.max_size: int = max_size
+
+    def apply(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        candidates = sudoku._candidates
+        hits = 0
+        for group in groups:
+            empty = [cell for cell in group if candidates[cell]]
+            for size in range(2, min(self.max_size, len(empty) - 1) + 1):
+                for subset in combinations(
+                    [cell for cell in empty if candidates[cell].bit_count() <= size],
+                    size,
+                ):
+                    numbers = 0
+                    for cell in subset:
+                        numbers |= candidates[cell]
+                    if numbers.bit_count() > size:
+                        continue
+                    for cell in empty:
+                        if cell not in subset:
+                            hits += sudoku._eliminate(cell, numbers)
+        return hits
+
+
+class HiddenSubset(Rule):
+    """
+    k numbers confined to the same k cells of a group clear every other number
+    from those cells
+    """
+
+    name = "hidden subset"
+
+    def __init__(self, enabled: bool = True, max_size: int = 3):
+        super().__init__(enabled)
+        self.max_size: int = max_size
+
+    def apply(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        positions = sudoku._positions
+        hits = 0
+        for group in groups:
+            position: dict[int, int] = dict()
+            numbers = group.available
+            while numbers:
+                number = (numbers & -numbers).bit_length() - 1
+                numbers &= numbers - 1
+                position[1 << number] = positions[number] & group.mask
+            for size in range(2, min(self.max_size, len(position) - 1) + 1):
+                for subset in combinations(
+                    [bit for bit, where in position.items() if where.bit_count() <= size],
+                    size,
+                ):
+                    where = 0
+                    for bit in subset:
+                        where |= position[bit]
+                    if where.bit_count() != size:
+                        continue
+                    numbers = sum(subset)
+                    while where:
+                        cell = (where & -where).bit_length() - 1
+                        where &= where - 1
+                        hits += sudoku._eliminate(cell, ~numbers)
+        return hits
+
+
+class LockedCandidates(Rule):
+    """
+    pointing / box-line reduction: a number of group A confined to A & B is
+    removed from B - A
+    """
+
+    name = "locked candidates"
+
+    def apply(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        pairs = sudoku._topology.pairs
+        positions = sudoku._positions
+        hits = 0
+        for group in groups:
+            for outside, rest in pairs[group.name]:
+                numbers = group.available
+                while numbers:
+                    number = (numbers & -numbers).bit_length() - 1
+                    numbers &= numbers - 1
+                    where = positions[number]
+                    if not where & group.mask or where & outside:
+                        continue
+                    where &= rest
+                    while where:
+                        cell = (where & -where).bit_length() - 1
+                        where &= where - 1
+                        hits += sudoku._eliminate(cell, 1 << number)
+        return hits
+
+
+class Fish(Rule):
+    """
+    X-Wing (size 2) / Swordfish (size 3): a number confined to the same k columns
+    in k rows is removed from the rest of those columns, and vice versa
+    """
+
+    name = "fish"
+
+    def __init__(self, enabled: bool = True, max_size: int = 2):
+        super().__init__(enabled)
+        self.max_size: int = max_size
+
+    def apply(self, sudoku: "SudokuBase", groups: set["Group"]) -> int | None:
+        """
+        rows as base with columns as cover, then the other way round; a cell's
+        position in its row is the index of its column and vice versa
+        """
+        if not any(group.name[0] in "hv" for group in groups):
+            return 0
+        candidates = sudoku._candidates
+        rows, columns = (
+            [sudoku._group[gidx] for gidx in line] for line in sudoku._topology.lines
+        )
+        hits = 0
+        for base, cover in ((rows, columns), (columns, rows)):
+            for number in range(sudoku._N):
+                bit = 1 << number
+                position = list()
+                for line in base:
+                    if not line.available & bit:
+                        continue
+                    where = 0
+                    for local, cell in enumerate(line.cells):
+                        if candidates[cell] & bit:
+                            where |= 1 << local
+                    if where and where.bit_count() <= self.max_size:
+                        position.append((line, where))
+                for size in range(2, min(self.max_size, len(position)) + 1):
+                    for subset in combinations(position, size):
+                        where = 0
+                        for _, line_where in subset:
+                            where |= line_where
+                        if where.bit_count() != size:
+                            continue
+                        fish = {cell for line, _ in subset for cell in line}
+                        for local in range(len(cover)):
+                            if not where & (1 << local):
+                                continue
+                            for cell in cover[local]:
+                                if cell not in fish:
+                                    hits += sudoku._eliminate(cell, bit)
+        return hits
+
+
+def default_rules() -> list[Rule]:
+    return [
+        HiddenSingle(),
+        LockedCandidates(),
+        NakedSubset(),
+        HiddenSubset(enabled=False),
+        Fish(enabled=False),
+    ]
@@ -0,0 +1,205 @@
+import time
+from typing import TYPE_CHECKING, Iterator, Literal
+
+if TYPE_CHECKING:
+    from instrument import Instrumentation
+    from sudoku import SudokuBase
+
+
+class Frame:
+    """
+    one branching decision: the cell being tried and the numbers left for it\n
+    mark: trail length before the node that led to this decision
+    """
+
+    def __init__(self, mark: int, idx: int, numbers: list[int]):
+        self.mark: int = mark
+        self.idx: int = idx
+        self.numbers: list[int] = numbers
+        self.next: int = 0
+
+    def __str__(self) -> str:
+        return f"cell {self.idx}: {self.numbers[:self.next]} | {self.numbers[self.next:]}"
+
+
+class Search:
+    """
+    Depth-first search over SudokuBase._propagate() with an explicit stack of Frame,
+    trying cells in the same order as the former recursive solvers.\n
+    run() stops at each solution (and after max_nodes nodes); calling it again
+    resumes where it stopped.\n
+    prefer: a board whose number is tried first at each cell, if still available\n
+    deadline: time.perf_counter() value, run() returns None once it is past
+    (checked before every node)
+    """
+
+    def __init__(
+        self,
+        sudoku: "SudokuBase",
+        method: Literal["minimum_case_first", "brute_forcing"] = "minimum_case_first",
+        prefer: list[int] | None = None,
+        deadline: float | None = None,
+    ):
+        if method not in ("minimum_case_first", "brute_forcing"):
+            raise Exception(f"Unknown search method: {method}")
+        self._sudoku: "SudokuBase" = sudoku
+        self._method: str = method
+        self._hooks: "Instrumentation | None" = sudoku._instrumentation
+        self._prefer: list[int] | None = prefer
+        self._deadline: float | None = deadline
+        self.stack: list[Frame] = list()
+        self.nodes: int = 0
+        self.backtracks: int = 0
+        self.max_depth: int = 0
+        self.propagate_time: float = 0.0
+        self.started: bool = False
+        self.finished: bool = False
+        self._leaf: int | None = None
+
+    @property
+    def depth(self) -> int:
+        return len(self.stack)
+
+    def run(self, max_nodes: int | None = None) -> bool | None:
+        """
+        True: the board holds a solution\n
+        False: no (more) solution\n
+        None: max_nodes reached or past the deadline, call run() again to continue
+        """
+        sudoku = self._sudoku
+        if self.finished:
+            return False
+        if self._leaf is not None:
+            self.__undo(self._leaf)
+            self._leaf = None
+        if not self.started:
+            self.started = True
+            if not self.__enter(len(sudoku._trail)):
+                return self.__finish()
+            if self._leaf is not None:
+                return True
+        limit = None if max_nodes is None else self.nodes + max_nodes
+        deadline = self._deadline
+        while self.stack:
+            if limit is not None and self.nodes >= limit:
+                return None
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            frame = self.stack[-1]
+            if frame.next == len(frame.numbers):
+                self.stack.pop()
+                self.__undo(frame.mark)
+                self.backtracks += 1
+                continue
+            number = frame.numbers[frame.next]
+            frame.next += 1
+            mark = len(sudoku._trail)
+            if not sudoku.put(frame.idx, number):
+                continue
+            if self.__enter(mark) and self._leaf is not None:
+                return True
+        return self.__finish()
+
+    def split(self, depth: int) -> Iterator[list[int]]:
+        """
+        yields a copy of the board at each node depth decisions below the root
+        (and at each solution found above that), in the order run() would visit them
+        """
+        sudoku = self._sudoku
+        self.started = True
+        if self.__enter(len(sudoku._trail)):
+            if self._leaf is not None:
+                yield sudoku._board.tolist()
+                self.__undo(self._leaf)
+                self._leaf = None
+        while self.stack:
+            frame = self.stack[-1]
+            if len(self.stack) > depth:
+                yield sudoku._board.tolist()
+            if len(self.stack) > depth or frame.next == len(frame.numbers):
+                self.stack.pop()
+                self.__undo(frame.mark)
+                continue
+            number = frame.numbers[frame.next]
+            frame.next += 1
+            mark = len(sudoku._trail)
+            if not sudoku.put(frame.idx, number):
+                continue
+            if self.__enter(mark) and self._leaf is not None:
+                yield sudoku._board.tolist()
+                self.__undo(self._leaf)
+                self._leaf = None
+        self.finished = True
+
+    def __enter(self, mark: int) -> bool:
+        """
+        propagates the node created since mark and pushes its branching decision;
+        sets self._leaf when the board got full
+        """
+        sudoku = self._sudoku
+        hooks = self._hooks
+        self.nodes += 1
+        if hooks is not None:
+            hooks.node(len(self.stack))
+        start = time.perf_counter_ns()
+        propagated = sudoku._propagate()
+        elapsed = time.perf_counter_ns() - start
+        self.propagate_time += elapsed / 1e9
+        if hooks is not None:
+            hooks.propagate(propagated, elapsed)
+        if not propagated:
+            if hooks is not None:
+                hooks.dead_end(len(self.stack))
+            self.__undo(mark)
+            self.backtracks += 1
+            return False
+        if sudoku._log and sudoku._log_level == "info":
+            sudoku._update_print()
+        if hooks is not None:
+            start = time.perf_counter_ns()
+        idx = self.__choose()
+        if idx is None:
+            self._leaf = mark
+            return True
+        numbers = sudoku._get_available_numbers(idx)
+        if self._prefer is not None and self._prefer[idx] in numbers:
+            numbers.remove(self._prefer[idx])
+            numbers.insert(0, self._prefer[idx])
+        if hooks is not None:
+            hooks.branch(idx, numbers, time.perf_counter_ns() - start)
+        self.stack.append(Frame(mark, idx, numbers))
+        self.max_depth = max(self.max_depth, len(self.stack))
+        return True
+
+    def __undo(self, mark: int) -> None:
+        if self._hooks is None:
+            self._sudoku._undo(mark)
+            return
+        start = time.perf_counter_ns()
+        self._sudoku._undo(mark)
+        self._hooks.undo(mark, time.perf_counter_ns() - start)
+
+    def __choose(self) -> int | None:
+        board = self._sudoku._board
+        if self._method == "brute_forcing":
+            for idx, cell in enumerate(board):
+                if not cell:
+                    return idx
+            return None
+        candidates = self._sudoku._candidates
+        min_possibility = [self._sudoku._N + 1, None]  # (possible_case, idx)
+        for idx, cell in enumerate(board):
+            if not cell:
+                possible_case = candidates[idx].bit_count()
+                if possible_case < min_possibility[0]:
+                    min_possibility[0], min_possibility[1] = possible_case, idx
+                    if possible_case == 2:
+                        break
+        return min_possibility[1]
+
+    def __finish(self) -> bool:
+        self.finished = True
+        return False
+
+    def __str__(self) -> str:
+        return "\n".join(str(frame) for frame in self.stack)
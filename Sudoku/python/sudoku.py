@@ -1,43 +1,23 @@
 from abc import ABCMeta, abstractmethod
-from functools import reduce
-from queue import Queue
+from array import array
+from collections import deque
 import random
 import time
 from typing import Literal
 
-from data import INIT_BOARD
-from util import flatten, get_digit
-from vars import COLOR, SUDOKU_TYPE, LOG_LEVEL
-
-
-class Group:
-    def __init__(self, name: str, cells: list[int], init_available: int):
-        self.name: str = name
-        self.cells: list[int] = sorted(cells)
-        self.available: int = reduce(
-            lambda acc, cur: acc + (1 << cur), range(len(cells)), 0
-        )
-        self.AVAILABLE: int = init_available
-
-    def disable(self, number: int) -> "Group":
-        if number < 1:
-            return
-        self.available &= ~(self.AVAILABLE & (1 << (number - 1)))
-        return self
-
-    def enable(self, number: int) -> "Group":
-        if number < 1:
-            return
-        self.available |= 1 << (number - 1)
-        return self
-
-    def __getitem__(self, idx: int) -> int:
-        return self.cells[idx]
-
-    def __str__(self) -> str:
-        return f"available: {
-            "".join([(str(idx+1) if idx+1<10 else chr(ord('a')+idx-9)) if self.available & (1 << idx) else '0' for idx in range(len(self.cells))])
-            }, {self.name}: [{', '.join(map(str, self.cells))}]"
+from cache import SolutionCache
+import canonical
+import corpus
+from dlx import DancingLinks
+from instrument import Instrumentation
+from result import SolveResult
+from rule import Rule, default_rules
+from search import Search
+from topology import Group, Topology
+from transform import Transform
+from util import flatten, get_digit, typecode
+from vars import BACKEND, COLOR, SUDOKU_TYPE, LOG_LEVEL
+import vectorized
 
 
 class SudokuBase(metaclass=ABCMeta):
@@ -49,13 +29,29 @@ class SudokuBase(metaclass=ABCMeta):
     ):
         self._N: int = N
         self._type: SUDOKU_TYPE = sudoku_type
-        self._INIT_BOARD: list[int] = list()
-        self._board: list[int] = list()
+        self._INIT_BOARD: array = array(typecode(N))
+        self._board: array = array(typecode(N))
         self._log: bool = False
         self._log_level: LOG_LEVEL = "info"
         self._optimized: bool = False
         self._group: list[Group] = list()
-        self._ref: list[list[Group]] = [[] for _ in self._board]
+        # flat, cell idx's group indices / peers are the slice from idx * size
+        self._ref: array = array("H")
+        self._ref_size: int = 0
+        self._peers: array = array("H")
+        self._peers_size: int = 0
+        self._candidates: list[int] = list()
+        self._positions: list[int] = list()
+        self._trail: list[tuple[list[int] | array | Group, int | None, int]] = list()
+        self._dirty: deque[int] = deque()
+        self._rules: list[Rule] = default_rules()
+        # deductions of _propagate(): naked singles filled plus rule hits
+        self._deductions: int = 0
+        # the loaded puzzle untouched since: _reset() has nothing to rebuild as long
+        # as the trail is empty and _propagate() did not consume the queue
+        self._pristine: bool = False
+        self._cache: SolutionCache | None = None
+        self._instrumentation: Instrumentation | None = None
         self.__init_board(board)
 
     def activate_log(
@@ -69,189 +65,455 @@ class SudokuBase(metaclass=ABCMeta):
         self._optimized = optimized
         return self
 
+    def use_cache(self, cache: SolutionCache | None) -> "SudokuBase":
+        """
+        solve() looks the puzzle up in cache first and stores what it finds there
+        """
+        self._cache = cache
+        return self
+
+    def instrument(
+        self, instrumentation: Instrumentation | None = None
+    ) -> "SudokuBase":
+        """
+        feeds the hooks of instrumentation from the searches of solve(),
+        count_solutions() and search(); None turns them off again
+        """
+        self._instrumentation = instrumentation
+        return self
+
+    def enable_rule(self, name: str, enabled: bool = True) -> "SudokuBase":
+        """
+        name: one of "hidden single", "locked candidates", "naked subset",
+        "hidden subset", "fish"; the rules only run when optimized
+        """
+        for rule in self._rules:
+            if rule.name == name:
+                rule.enabled = enabled
+                return self
+        raise Exception(f"Unknown rule: {name}")
+
+    def rule_stats(self) -> dict[str, dict[str, bool | int | float]]:
+        return {
+            rule.name: {
+                "enabled": rule.enabled,
+                "calls": rule.calls,
+                "hits": rule.hits,
+                "time": rule.time,
+            }
+            for rule in self._rules
+        }
+
+    def candidates(self, idx: int) -> int:
+        """
+        bitmask of the numbers still available at idx (bit n-1 for number n),
+        0 for a filled cell
+        """
+        return self._candidates[idx]
+
+    def positions(self, number: int) -> int:
+        """
+        bitmask of the empty cells number can still go to (bit idx for cell idx)
+        """
+        return self._positions[number - 1]
+
     def put(self, idx: int, value: int) -> bool:
-        self._board[idx] = value
-        if not self.__is_valid_cell(idx):
+        bit = 1 << (value - 1)
+        if self._board[idx] or not self._candidates[idx] & bit:
             return False
-        for group in self._ref[idx]:
+        trail = self._trail
+        positions = self._positions
+        trail.append((self._board, idx, 0))
+        trail.append((self._candidates, idx, self._candidates[idx]))
+        rest = self._candidates[idx] & ~bit
+        while rest:
+            number = (rest & -rest).bit_length() - 1
+            trail.append((positions, number, positions[number]))
+            positions[number] &= ~(1 << idx)
+            rest &= rest - 1
+        self._board[idx] = value
+        self._candidates[idx] = 0
+        self._dirty.append(idx)
+        groups = self._group
+        start = idx * self._ref_size
+        covered = 0
+        for gidx in self._ref[start : start + self._ref_size]:
+            group = groups[gidx]
+            trail.append((group, None, group.available))
             group.disable(value)
+            covered |= group.mask
+        trail.append((positions, value - 1, positions[value - 1]))
+        positions[value - 1] &= ~covered
+        start = idx * self._peers_size
+        for peer in self._peers[start : start + self._peers_size]:
+            if self._candidates[peer] & bit:
+                trail.append((self._candidates, peer, self._candidates[peer]))
+                self._candidates[peer] ^= bit
+                self._dirty.append(peer)
         return True
 
+    def _eliminate(self, idx: int, mask: int) -> int:
+        """
+        removes the numbers of mask from the candidates of idx
+        returns 1 if anything was removed
+        """
+        removed = self._candidates[idx] & mask
+        if not removed:
+            return 0
+        trail = self._trail
+        positions = self._positions
+        trail.append((self._candidates, idx, self._candidates[idx]))
+        self._candidates[idx] ^= removed
+        while removed:
+            number = (removed & -removed).bit_length() - 1
+            trail.append((positions, number, positions[number]))
+            positions[number] &= ~(1 << idx)
+            removed &= removed - 1
+        self._dirty.append(idx)
+        return 1
+
+    def _groups_of(self, idx: int) -> list[Group]:
+        """
+        the groups cell idx is in, from the flat self._ref
+        """
+        start = idx * self._ref_size
+        return [self._group[gidx] for gidx in self._ref[start : start + self._ref_size]]
+
+    def _undo(self, mark: int) -> None:
+        """
+        restores every mask changed since len(self._trail) was mark
+        """
+        trail = self._trail
+        while len(trail) > mark:
+            target, key, value = trail.pop()
+            if key is None:
+                target.available = value
+            else:
+                target[key] = value
+
     def solve(
         self,
-        method: Literal["minimum_case_first", "brute_forcing"] = "minimum_case_first",
-    ) -> None:
-        self._board = self._INIT_BOARD.copy()
+        method: Literal[
+            "minimum_case_first", "brute_forcing", "dlx"
+        ] = "minimum_case_first",
+        backend: BACKEND = "auto",
+        timeout: float | None = None,
+    ) -> SolveResult:
+        """
+        backend: "numpy" runs minimum_case_first on a candidate tensor with
+        vectorized eliminations (any other method raises); "auto" picks it for
+        minimum_case_first from vectorized.AUTO_MIN_N on if numpy is installed\n
+        timeout: seconds; past it the status is "timeout" and the board is reset\n
+        nothing is printed unless the log is activated
+        """
+        start = time.perf_counter()
+        deadline = None if timeout is None else start + timeout
+        backend = self._select_backend(backend, method)
+        result = SolveResult(method, backend)
+        self._reset()
+        lap = time.perf_counter()
+        result.times["reset"] = lap - start
         if self._log:
             print(self)
-            start = time.time()
-        if method == "brute_forcing":
-            result = self.__solve_brute_forcing(0, self._board[0])
-        elif method == "minimum_case_first":
-            result = self.__solve_minimum_case_first(0, self._board[0])
-        if not result:
-            print("Unsolvable")
+        found = None
+        if self._cache is not None:
+            found = self.__load(self._cache.get(self, deadline))
+            result.cached = found is not None
+            result.times["cache"] = time.perf_counter() - lap
+        if found is None:
+            lap = time.perf_counter()
+            if backend == "numpy":
+                found = self._solve_vectorized(result, deadline)
+            elif method in ("brute_forcing", "minimum_case_first"):
+                found = self.__search(method, result, deadline)
+            elif method == "dlx":
+                found = self.__solve_dlx(result, deadline)
+            else:
+                raise Exception(f"Unknown method: {method}")
+            result.times["search"] = time.perf_counter() - lap
+            if self._cache is not None and found is not None:
+                lap = time.perf_counter()
+                self._cache.put(self, self._board if found else None, deadline)
+                result.times["cache"] += time.perf_counter() - lap
+        if found is None:
+            self._undo(0)
+            result.status = "timeout"
+        elif found:
+            result.status = "solved"
+            result.solution = self._board.tolist()
+        result.times["total"] = time.perf_counter() - start
         if self._log:
-            end = time.time()
-            print(f"{end - start:.2f}sec")
-
-    def __solve_brute_forcing(self, init_idx: int, init_number: int) -> bool:
-        self._board[init_idx] = init_number
-        for group in self._ref[init_idx]:
-            group.disable(init_number)
+            if result.status != "solved":
+                print(result.status.capitalize())
+            print(f"{result.times['total']:.2f}sec")
+        return result
 
-        fill: set[int] = set()
-        queue: Queue[tuple[int, int]] = Queue()
-        for idx, cell in enumerate(self._board):
-            if cell:
-                continue
-            available_numbers = self._get_available_numbers(idx)
-            if len(available_numbers) == 1:
-                queue.put((idx, available_numbers[0]))
-            elif len(available_numbers) == 0:
-                self._delete_cell(init_idx)
-                return False
+    def search(
+        self,
+        method: Literal["minimum_case_first", "brute_forcing"] = "minimum_case_first",
+    ) -> Search:
+        """
+        resets the board and returns a resumable search over it, see Search.run()
+        """
+        self._reset()
+        return Search(self, method)
 
-        while not queue.empty():
-            idx, available_number = queue.get()
-            if self._board[idx]:
-                continue
+    def count_solutions(
+        self,
+        limit: int | None = 2,
+        method: Literal["minimum_case_first", "brute_forcing"] = "minimum_case_first",
+    ) -> int:
+        """
+        counts solutions, stopping as soon as limit (None: no limit) is reached;
+        the board holds the last solution found, or the initial board if the
+        search ran out
+        """
+        search = self.search(method)
+        count = 0
+        while (limit is None or count < limit) and search.run():
+            count += 1
+        return count
 
-            fill.add(idx)
-            if not self.put(idx, available_number):
-                for cell in fill:
-                    self._delete_cell(cell)
-                self._delete_cell(init_idx)
-                return False
+    def is_unique(self) -> bool:
+        return self.count_solutions(2) == 1
 
-            if self._log and self._log_level == "debug":
-                self._update_print()
+    def reset(
+        self, board: list[list[int]] | list[int] | bytes | array | None = None
+    ) -> "SudokuBase":
+        """
+        loads board as the new puzzle (None: a random one), keeping the topology,
+        the settings, rules, cache and instrumentation of this instance\n
+        on an invalid board it raises and the previous puzzle stays loaded
+        """
+        try:
+            self.__init_board(board)
+        except Exception:
+            self._reset()
+            raise
+        return self
 
-            for group in self._ref[idx]:
-                group.disable(available_number)
+    @classmethod
+    def from_string(cls, line: str, delimiter: str | None = None) -> "SudokuBase":
+        """
+        a puzzle in the line format of corpus.parse_line(), e.g. "4.....8.5.3....."
+        """
+        return cls.from_bytes(line.encode(), delimiter)
 
-            for group in self._ref[idx]:
-                for ref_cell in group:
-                    if not self._board[ref_cell]:
-                        available_numbers = self._get_available_numbers(ref_cell)
-                        if len(available_numbers) == 1:
-                            queue.put((ref_cell, available_numbers[0]))
+    @classmethod
+    def from_bytes(cls, line: bytes, delimiter: str | None = None) -> "SudokuBase":
+        """
+        from_string() of a line as read from a file
+        """
+        return cls(board=corpus.parse_line(line, delimiter=delimiter))
 
-        if self._log and self._log_level == "info":
-            self._update_print()
-        if not self.__count_empty_cell():
-            return True
+    @classmethod
+    def from_buffer(
+        cls, buffer: bytes | bytearray | memoryview | array
+    ) -> "SudokuBase":
+        """
+        the cell values themselves, row by row and one per item, 0 for an empty
+        cell: bytes, an array.array or anything else with the buffer protocol
+        """
+        return cls(board=buffer)
 
-        for idx, cell in enumerate(self._board):
-            if not cell:
-                available_numbers = self._get_available_numbers(idx)
-                if len(available_numbers):
-                    for number in available_numbers:
-                        if self.__solve_brute_forcing(idx, number):
-                            return True
-                    for idx in fill:
-                        self._delete_cell(idx)
-                    self._delete_cell(init_idx)
+    def _reset(self) -> None:
+        """
+        back to the loaded puzzle, rebuilding the board and groups only if anything
+        touched them since it was loaded or last reset
+        """
+        if not self._pristine or self._trail:
+            self._board = self._INIT_BOARD[:]
+            self._make_group()
+            self._trail = list()
+            self._dirty = deque(idx for idx, cell in enumerate(self._board) if not cell)
+            self._pristine = True
+        for rule in self._rules:
+            rule.reset()
+
+    def _propagate(self) -> bool:
+        """
+        fills naked singles reachable from the cells queued in self._dirty;
+        when optimized, runs the enabled rules on the groups those cells touched
+        until nothing changes
+        """
+        self._pristine = False
+        dirty = self._dirty
+        rules = [rule for rule in self._rules if rule.enabled] if self._optimized else []
+        touched: list[int] = list()
+        seen = [0 for _ in rules]
+        while True:
+            while dirty:
+                idx = dirty.popleft()
+                if rules:
+                    touched.append(idx)
+                if self._board[idx]:
+                    continue
+                available_numbers = self._candidates[idx]
+                if not available_numbers:
+                    dirty.clear()
+                    return False
+                if available_numbers & (available_numbers - 1):
+                    continue
+                self.put(idx, available_numbers.bit_length())
+                self._deductions += 1
+                if self._log and self._log_level == "debug":
+                    self._update_print()
+            for ridx, rule in enumerate(rules):
+                if seen[ridx] == len(touched):
+                    continue
+                groups = {
+                    self._group[gidx]
+                    for idx in touched[seen[ridx] :]
+                    for gidx in self._ref[
+                        idx * self._ref_size : (idx + 1) * self._ref_size
+                    ]
+                }
+                seen[ridx] = len(touched)
+                result = rule(self, groups)
+                if result is None:
+                    dirty.clear()
                     return False
+                if result:
+                    self._deductions += result
+                    break
+            else:
+                return True
 
-    def __solve_minimum_case_first(self, init_idx: int, init_number: int) -> bool:
-        self._board[init_idx] = init_number
-        for group in self._ref[init_idx]:
-            group.disable(init_number)
+    def __load(self, solution: list[int] | None) -> bool | None:
+        """
+        puts a cached solution on the board; None on a miss or if it does not fit
+        """
+        if solution is None:
+            return None
+        if not solution:
+            return False
+        for idx, value in enumerate(solution):
+            if not self._board[idx] and not self.put(idx, value):
+                self._reset()
+                return None
+        if self._log and self._log_level == "info":
+            self._update_print()
+        return True
 
-        fill: set[int] = set()
-        queue: Queue[tuple[int, int]] = Queue()
+    def __search(
+        self,
+        method: Literal["minimum_case_first", "brute_forcing"],
+        result: SolveResult,
+        deadline: float | None,
+    ) -> bool | None:
+        """
+        Search.run() checking the deadline before every node
+        """
+        search = Search(self, method, deadline=deadline)
+        deductions = self._deductions
+        found = search.run()
+        result.nodes = search.nodes
+        result.backtracks = search.backtracks
+        result.propagations = self._deductions - deductions
+        result.max_depth = search.max_depth
+        result.times["propagate"] = search.propagate_time
+        return found
+
+    def __solve_dlx(self, result: SolveResult, deadline: float | None) -> bool | None:
+        """
+        exact cover: one column per empty cell and per (group, missing number),
+        one row per (cell, number) candidate\n
+        building the matrix checks the deadline once per empty cell
+        """
+        rows: list[tuple[int, int]] = list()
         for idx, cell in enumerate(self._board):
             if cell:
                 continue
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
             available_numbers = self._get_available_numbers(idx)
-            if len(available_numbers) == 1:
-                queue.put((idx, available_numbers[0]))
-            elif len(available_numbers) == 0:
-                self._delete_cell(init_idx)
-                return False
-
-        while not queue.empty():
-            idx, available_number = queue.get()
-            if self._board[idx]:
-                continue
-
-            fill.add(idx)
-            if not self.put(idx, available_number):
-                for cell in fill:
-                    self._delete_cell(cell)
-                self._delete_cell(init_idx)
+            if not available_numbers:
                 return False
-
-            if self._log and self._log_level == "debug":
+            rows.extend((idx, number) for number in available_numbers)
+        columns = [("c", idx) for idx, cell in enumerate(self._board) if not cell]
+        columns.extend(
+            ("g", gidx, number + 1)
+            for gidx, group in enumerate(self._group)
+            for number in range(self._N)
+            if group.available & (1 << number)
+        )
+        links = DancingLinks(columns)
+        size = self._ref_size
+        for idx, number in rows:
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            links.add_row(
+                (idx, number),
+                [("c", idx)]
+                + [
+                    ("g", gidx, number)
+                    for gidx in self._ref[idx * size : (idx + 1) * size]
+                ],
+            )
+        found = False
+        for solution in links.solutions(deadline):
+            for idx, number in solution:
+                self.put(idx, number)
+            if self._log and self._log_level == "info":
                 self._update_print()
-
-            for group in self._ref[idx]:
-                group.disable(available_number)
-
-            for group in self._ref[idx]:
-                for ref_cell in group:
-                    if not self._board[ref_cell]:
-                        available_numbers = self._get_available_numbers(ref_cell)
-                        if len(available_numbers) == 1:
-                            queue.put((ref_cell, available_numbers[0]))
-        if self._log and self._log_level == "info":
-            self._update_print()
-        if not self.__count_empty_cell():
-            return True
-
-        min_possibility = [self._N + 1, None]  # (possible_case, idx)
-        for idx, cell in enumerate(self._board):
-            if not cell:
-                available_numbers = self._get_available_numbers(idx)
-                if len(available_numbers) < min_possibility[0]:
-                    min_possibility[0], min_possibility[1] = len(available_numbers), idx
-                    if len(available_numbers) == 2:
-                        break
-        available_numbers = self._get_available_numbers(min_possibility[1])
-        for number in available_numbers:
-            if self.__solve_minimum_case_first(min_possibility[1], number):
-                return True
-        for idx in fill:
-            self._delete_cell(idx)
-        self._delete_cell(init_idx)
-        return False
-
-    def __init_board(self, board: list[list[int]] | list[int] | None = None) -> None:
-        if board:
-            self._board = flatten(board)
+            found = True
+            break
+        result.nodes = links.nodes
+        result.backtracks = links.backtracks
+        result.max_depth = links.max_depth
+        return None if links.timed_out else found
+
+    def __init_board(
+        self, board: list[list[int]] | list[int] | bytes | array | None = None
+    ) -> None:
+        self._pristine = False
+        if board is not None and len(board):
+            self._board = self.__as_board(board)
         else:
             self._make_random_board()
-        self._make_group()
         if not self.__is_valid_board():
             raise Exception("Invalid Board Provided")
-        self._INIT_BOARD = self._board.copy()
+        self._make_group()
+        self._INIT_BOARD = self._board[:]
+        self._trail = list()
+        self._dirty = deque(idx for idx, cell in enumerate(self._board) if not cell)
+        self._pristine = True
 
-    def __is_valid_cell(self, idx: int) -> bool:
-        if not self._board[idx]:
-            for group in self._ref[idx]:
-                if not group.available:
-                    return False
-            return True
-        for group in self._ref[idx]:
-            for ref_cell in group:
-                if ref_cell != idx and self._board[ref_cell] == self._board[idx]:
-                    return False
-        return True
+    def __as_board(self, board: list[list[int]] | list[int] | bytes | array) -> array:
+        """
+        flatten() only for nested boards; flat lists and buffers are copied as is
+        """
+        code = typecode(self._N)
+        if isinstance(board, (bytes, bytearray)):
+            board = board if code == "B" else list(board)
+        elif vectorized.np is not None and isinstance(board, vectorized.np.ndarray):
+            board = board.ravel().tolist()
+        elif not isinstance(board, (memoryview, array)) and not isinstance(
+            board[0], int
+        ):
+            board = flatten(board)
+        try:
+            return array(code, board)
+        except (OverflowError, TypeError, ValueError):
+            raise Exception("Invalid Board Provided") from None
 
     def __is_valid_board(self) -> bool:
-        if not self._is_valid_board_length():
-            return False
-        for cell in self._board:
-            if not self.__is_valid_cell(cell):
-                return False
-        return True
+        return self._is_valid_board_length() and self._is_valid_board_numbers()
+
+    @abstractmethod
+    def canonical_form(
+        self, deadline: float | None = None
+    ) -> tuple[list[int], Transform] | None:
+        pass
 
-    def __count_empty_cell(self) -> int:
-        return reduce(lambda acc, cur: acc + 1 if not cur else acc, self._board, 0)
+    @abstractmethod
+    def _select_backend(self, backend: BACKEND, method: str) -> BACKEND:
+        pass
 
     @abstractmethod
-    def _delete_cell(self, idx: int) -> None:
+    def _solve_vectorized(
+        self, result: SolveResult, deadline: float | None
+    ) -> bool | None:
         pass
 
     @abstractmethod
@@ -262,6 +524,10 @@ class SudokuBase(metaclass=ABCMeta):
     def _is_valid_board_length(self) -> bool:
         pass
 
+    @abstractmethod
+    def _is_valid_board_numbers(self) -> bool:
+        pass
+
     @abstractmethod
     def _make_group(self) -> None:
         pass
@@ -302,188 +568,147 @@ class SudokuNxN(SudokuBase):
         self._hgN: int = hgN
         self._vgN: int = vgN
         self._N: int = N
-        self.AVAILABLE = reduce(lambda acc, cur: acc + (1 << cur), range(self._N), 0)
+        self._topology: Topology = Topology.of(N, hgN, vgN)
+        self.AVAILABLE: int = self._topology.AVAILABLE
         super().__init__(sudoku_type, N, board)
 
-    def _delete_cell(self, idx: int):
-        for group in self._ref[idx]:
-            for cell in group:
-                if cell != idx and self._board[cell] == self._board[idx]:
-                    break
-            else:
-                group.enable(self._board[idx])
-        self._board[idx] = 0
+    def canonical_form(
+        self, deadline: float | None = None
+    ) -> tuple[list[int], Transform] | None:
+        """
+        the same board for every symmetric copy of the puzzle, and the Transform
+        from the puzzle to it (see canonical.canonical_form()); None if deadline
+        (a time.perf_counter() value) passes first
+        """
+        return canonical.canonical_form(
+            self._INIT_BOARD, self._N, self._hgN, self._vgN, deadline
+        )
+
+    def canonical_hash(self) -> str:
+        return canonical.canonical_hash(self._INIT_BOARD, self._N, self._hgN, self._vgN)
 
     def _get_available_numbers(self, idx: int) -> list[int]:
-        if self._board[idx]:
+        available_numbers = self._candidates[idx]
+        if not available_numbers:
             return []
-        available_numbers = self.AVAILABLE
-        for group in self._ref[idx]:
-            available_numbers &= group.available
-        for group in self._ref[idx]:
+        for group in self._groups_of(idx):
             if self._optimized and group.name[0] == "g":
-                global_available_numbers = 0
-                for cell in group:
-                    if self._board[cell] or cell == idx:
-                        continue
-                    local_available_numbers = self.AVAILABLE
-                    for ref_group in self._ref[cell]:
-                        local_available_numbers &= ref_group.available
-                    global_available_numbers |= local_available_numbers
-
                 numbers = [
                     num + 1
                     for num in range(self._N)
-                    if available_numbers & (~global_available_numbers) & (1 << num)
+                    if available_numbers & (1 << num)
+                    and self._positions[num] & group.mask == 1 << idx
                 ]
                 if len(numbers) == 1:
                     return numbers
         return [num + 1 for num in range(self._N) if available_numbers & (1 << num)]
 
+    def _select_backend(self, backend: BACKEND, method: str) -> BACKEND:
+        if backend == "numpy" and method != "minimum_case_first":
+            raise Exception(f"The numpy backend does not run {method}")
+        if backend != "auto":
+            return backend
+        if (
+            method == "minimum_case_first"
+            and vectorized.AUTO_MIN_N is not None
+            and self._N >= vectorized.AUTO_MIN_N
+            and vectorized.available()
+        ):
+            return "numpy"
+        return "python"
+
+    def _solve_vectorized(
+        self, result: SolveResult, deadline: float | None
+    ) -> bool | None:
+        tensor = vectorized.CandidateTensor(self._board, self._N, self._hgN, self._vgN)
+        found = tensor.solve(deadline)
+        result.nodes = tensor.nodes
+        result.backtracks = tensor.backtracks
+        result.propagations = tensor.propagations
+        result.max_depth = tensor.max_depth
+        if not found:
+            return found
+        for idx, value in enumerate(tensor.flatten()):
+            if not self._board[idx]:
+                self.put(idx, value)
+        if self._log and self._log_level == "info":
+            self._update_print()
+        return True
+
     def _is_valid_board_length(self) -> bool:
         return len(self._board) == self._N * self._N
 
+    def _is_valid_board_numbers(self) -> bool:
+        return self._topology.is_valid(self._board)
+
     def _make_group(self) -> None:
-        self._ref = [[] for _ in range(self._N * self._N)]
-        self._group = list()
-        for idx in range(self._N):
-            self._group.append(
-                Group(
-                    f"v{idx}",
-                    [idx + _ * self._N for _ in range(self._N)],
-                    self.AVAILABLE,
-                )
-            )
-            self._group.append(
-                Group(
-                    f"h{idx}",
-                    [idx * self._N + _ for _ in range(self._N)],
-                    self.AVAILABLE,
-                )
-            )
-            self._group.append(
-                Group(
-                    f"g{idx}",
-                    self.__make_NxN_group(idx),
-                    self.AVAILABLE,
-                )
-            )
+        """
+        copies the groups of the shared topology and fills in what the board takes
+        """
+        topology = self._topology
+        self._ref, self._ref_size = topology.ref, topology.ref_size
+        self._peers, self._peers_size = topology.peers, topology.peers_size
+        board = self._board
+        self._group = [group.copy() for group in topology.groups]
         for group in self._group:
-            for cell in group:
-                group.disable(self._board[cell])
-                self._ref[cell].append(group)
-
-    def __make_NxN_group(self, idx: int) -> list[int]:
-        return list(
-            map(
-                int,
-                [
-                    (idx // self._vgN) * (self._N * int(self._N / self._hgN))
-                    + (idx % self._vgN) * int(self._N / self._vgN)
-                    + ridx * self._N
-                    + cidx
-                    for cidx in range(int(self._N / self._vgN))
-                    for ridx in range(int(self._N / self._hgN))
-                ],
-            )
+            taken = 0
+            for cell in group.cells:
+                taken |= 1 << board[cell]
+            group.available &= ~(taken >> 1)
+        available = [group.available for group in self._group]
+        ref = self._ref
+        self._candidates = [
+            0 if cell else available[column] & available[row] & available[box]
+            for cell, column, row, box in zip(board, ref[0::3], ref[1::3], ref[2::3])
+        ]
+        empty = int(b"0" + bytes(0x30 if cell else 0x31 for cell in board[::-1]), 2)
+        self._positions = list()
+        for number in range(self._N):
+            taken = 0
+            for group in self._group:
+                if not group.available & (1 << number):
+                    taken |= group.mask
+            self._positions.append(empty & ~taken)
+
+    def _make_seed_board(self) -> None:
+        """
+        a full solution in closed form: row r is the first row shifted by
+        box width * (r % box height) + r // box height
+        """
+        height, width = self._N // self._hgN, self._N // self._vgN
+        self._board = array(
+            typecode(self._N),
+            [
+                (width * (row % height) + row // height + col) % self._N + 1
+                for row in range(self._N)
+                for col in range(self._N)
+            ],
         )
 
     def _make_random_board(self) -> None:
-        if self._type in INIT_BOARD:
-            self._board = flatten(INIT_BOARD[self._type])
-        else:
-            self._board = [0 for _ in range(self._N * self._N)]
+        self._make_seed_board()
         self._shuffle_board()
-        sample = random.sample(
-            [_ for _ in range(len(self._board))],
-            random.randint(int(self._N * self._N * 0.4), int(self._N * self._N * 0.6)),
+        sample = set(
+            random.sample(
+                [_ for _ in range(len(self._board))],
+                random.randint(
+                    int(self._N * self._N * 0.4), int(self._N * self._N * 0.6)
+                ),
+            )
+        )
+        self._board = array(
+            typecode(self._N),
+            [
+                self._board[idx] if idx in sample else 0
+                for idx in range(len(self._board))
+            ],
         )
-        self._board = [
-            self._board[idx] if idx in sample else 0 for idx in range(len(self._board))
-        ]
 
     def _shuffle_board(self) -> None:
-        self.__shuffle_board_number()
-        self.__shuffle_board_horizontal()
-        self.__shuffle_board_vertical()
-
-    def __shuffle_board_horizontal(self) -> None:
-        """
-        shuffle rows
-        """
-        row = [r for r in range(int(self._N / self._hgN))]
-        for hgidx in range(self._hgN):
-            random.shuffle(row)
-            visited = [False for _ in range(len(row))]
-            for r in range(len(row)):
-                if row[r] == r or visited[r]:
-                    continue
-                cur = r
-                row_to_be_changed = [
-                    self._board[
-                        (hgidx * int(self._N / self._hgN) + row[cur]) * self._N + cidx
-                    ]
-                    for cidx in range(self._N)
-                ]
-                while not visited[cur]:
-                    visited[cur] = True
-                    for cidx in range(self._N):
-                        tmp = self._board[
-                            (hgidx * int(self._N / self._hgN) + cur) * self._N + cidx
-                        ]
-                        self._board[
-                            (hgidx * int(self._N / self._hgN) + cur) * self._N + cidx
-                        ] = row_to_be_changed[cidx]
-                        row_to_be_changed[cidx] = tmp
-                    cur = row.index(cur)
-
-    def __shuffle_board_vertical(self) -> None:
-        """
-        shuffle columns
-        """
-        col = [c for c in range(int(self._N / self._vgN))]
-        for vgidx in range(self._vgN):
-            random.shuffle(col)
-            visited = [False for _ in range(len(col))]
-            for c in range(len(col)):
-                if col[c] == c or visited[c]:
-                    continue
-                cur = c
-                column_to_be_changed = [
-                    self._board[
-                        cidx * self._N + (vgidx * int(self._N / self._vgN) + col[cur])
-                    ]
-                    for cidx in range(self._N)
-                ]
-                while not visited[cur]:
-                    visited[cur] = True
-                    for cidx in range(self._N):
-                        tmp = self._board[
-                            cidx * self._N + (vgidx * int(self._N / self._vgN) + cur)
-                        ]
-                        self._board[
-                            cidx * self._N + (vgidx * int(self._N / self._vgN) + cur)
-                        ] = column_to_be_changed[cidx]
-                        column_to_be_changed[cidx] = tmp
-
-                    cur = col.index(cur)
-
-    def __shuffle_board_number(self) -> None:
-        """
-        shuffle numbers
-        """
-        num = [n + 1 for n in range(self._N)]
-        random.shuffle(num)
-
-        num_idx = [
-            [idx for idx, cell in enumerate(self._board) if (cell == n + 1)]
-            for n in range(self._N)
-        ]
-        for number in range(self._N):
-            if (number + 1) == num[number]:
-                continue
-            for idx in num_idx[number]:
-                self._board[idx] = num[number]
+        self._board = array(
+            typecode(self._N),
+            Transform.random(self._N, self._hgN, self._vgN).apply(self._board),
+        )
 
     def _update_print(self) -> None:
         print("\033[A" * (self._N + self._hgN + 1))
@@ -585,3 +810,29 @@ class Sudoku25x25(SudokuNxN):
 class Sudoku121x121(SudokuNxN):
     def __init__(self, board: list[list[int]] | list[int] | None = None):
         super().__init__("121x121", 121, 11, 11, board)
+
+
+def make_sudoku_class(hgN: int, vgN: int) -> type[SudokuNxN]:
+    """
+    SudokuNxN subclass with N = hgN * vgN, named like the classes above
+    (Sudoku{N}x{N}, "h" / "v" suffix for boxes wider / taller than high / wide)\n
+    the class is registered in this module so it can be pickled by batch.py
+    """
+    N = hgN * vgN
+    sudoku_type = f"{N}x{N}" + ("h" if hgN > vgN else "v" if hgN < vgN else "")
+    name = f"Sudoku{sudoku_type}"
+    if name in globals():
+        return globals()[name]
+
+    def __init__(self, board: list[list[int]] | list[int] | None = None):
+        SudokuNxN.__init__(self, sudoku_type, N, hgN, vgN, board)
+
+    sudoku_class = type(name, (SudokuNxN,), {"__init__": __init__})
+    sudoku_class.__module__ = __name__
+    globals()[name] = sudoku_class
+    return sudoku_class
+
+
+Sudoku36x36 = make_sudoku_class(6, 6)
+Sudoku64x64 = make_sudoku_class(8, 8)
+Sudoku100x100 = make_sudoku_class(10, 10)
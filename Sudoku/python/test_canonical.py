@@ -0,0 +1,65 @@
+import random
+import time
+import unittest
+
+from canonical import canonical_form
+from transform import Transform
+
+
+def _pattern(N: int, hgN: int, vgN: int) -> list[int]:
+    """
+    a solved board: row r of band b starts (r * width + b) numbers in
+    """
+    height, width = N // hgN, N // vgN
+    return [
+        ((row % height) * width + row // height + col) % N + 1
+        for row in range(N)
+        for col in range(N)
+    ]
+
+
+class CanonicalFormTest(unittest.TestCase):
+    SHAPES = ((9, 3, 3), (6, 2, 3), (12, 4, 3), (16, 4, 4), (25, 5, 5))
+    # seconds for one form, the old search took minutes on sparse 25x25 boards
+    TIME_LIMIT = 2.0
+
+    def assert_same_form(self, board: list[int], N: int, hgN: int, vgN: int):
+        form, transform = canonical_form(board, N, hgN, vgN)
+        self.assertEqual(list(transform.apply(board)), form)
+        for _ in range(5):
+            copy = list(Transform.random(N, hgN, vgN).apply(board))
+            start = time.perf_counter()
+            copy_form, copy_transform = canonical_form(copy, N, hgN, vgN)
+            self.assertLess(time.perf_counter() - start, self.TIME_LIMIT)
+            self.assertEqual(copy_form, form)
+            self.assertEqual(list(copy_transform.apply(copy)), form)
+
+    def test_sparse(self):
+        random.seed(15)
+        for N, hgN, vgN in self.SHAPES:
+            for share in (0.05, 0.2):
+                with self.subTest(N=N, hgN=hgN, vgN=vgN, share=share):
+                    board = [
+                        number if random.random() < share else 0
+                        for number in _pattern(N, hgN, vgN)
+                    ]
+                    self.assert_same_form(board, N, hgN, vgN)
+
+    def test_empty(self):
+        for N, hgN, vgN in self.SHAPES:
+            with self.subTest(N=N, hgN=hgN, vgN=vgN):
+                self.assert_same_form([0 for _ in range(N * N)], N, hgN, vgN)
+
+    def test_distinct(self):
+        N, hgN, vgN = 9, 3, 3
+        one = [0 for _ in range(N * N)]
+        one[0], one[1] = 1, 2
+        two = [0 for _ in range(N * N)]
+        two[0], two[N + 3] = 1, 2
+        self.assertNotEqual(
+            canonical_form(one, N, hgN, vgN)[0], canonical_form(two, N, hgN, vgN)[0]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+from array import array
+from itertools import combinations
+from operator import itemgetter
+from typing import Iterable, Iterator, Sequence
+
+from util import typecode
+import vectorized
+
+
+class Group:
+    __slots__ = ("name", "cells", "available", "AVAILABLE", "mask")
+
+    def __init__(self, name: str, cells: Iterable[int], init_available: int):
+        cells = sorted(cells)
+        self.name: str = name
+        self.cells: array = array(typecode(cells[-1]), cells)
+        self.available: int = (1 << len(cells)) - 1
+        self.AVAILABLE: int = init_available
+        self.mask: int = sum(1 << cell for cell in cells)
+
+    def disable(self, number: int) -> "Group":
+        if number < 1:
+            return
+        self.available &= ~(self.AVAILABLE & (1 << (number - 1)))
+        return self
+
+    def enable(self, number: int) -> "Group":
+        if number < 1:
+            return
+        self.available |= 1 << (number - 1)
+        return self
+
+    def copy(self) -> "Group":
+        """
+        same name, cells and mask (shared, they never change), own availability
+        """
+        group = Group.__new__(Group)
+        group.name = self.name
+        group.cells = self.cells
+        group.mask = self.mask
+        group.available = self.available
+        group.AVAILABLE = self.AVAILABLE
+        return group
+
+    def __getitem__(self, idx: int) -> int:
+        return self.cells[idx]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __str__(self) -> str:
+        return f"available: {
+            "".join([(str(idx+1) if idx+1<10 else chr(ord('a')+idx-9)) if self.available & (1 << idx) else '0' for idx in range(len(self.cells))])
+            }, {self.name}: [{', '.join(map(str, self.cells))}]"
+
+
+class Topology:
+    """
+    Everything about an N x N board that only depends on its shape: the groups
+    (columns, rows and boxes, all numbers available), the flat cell -> group
+    index references, the flat, deduplicated peer lists and what the rules need
+    of them (the rows and columns for Fish, the overlapping group pairs for
+    LockedCandidates).\n
+    Built once per (N, hgN, vgN) by Topology.of() and shared by every instance
+    of that shape, so none of it may be changed; instances copy the groups.\n
+    """
+
+    __cache: dict[tuple[int, int, int], "Topology"] = dict()
+
+    def __init__(self, N: int, hgN: int, vgN: int):
+        height, width = N // hgN, N // vgN
+        self.N: int = N
+        self.hgN: int = hgN
+        self.vgN: int = vgN
+        self.AVAILABLE: int = (1 << N) - 1
+        groups: list[Group] = list()
+        for idx in range(N):
+            groups.append(Group(f"v{idx}", range(idx, N * N, N), self.AVAILABLE))
+            groups.append(Group(f"h{idx}", range(idx * N, idx * N + N), self.AVAILABLE))
+            first = (idx // vgN) * N * height + (idx % vgN) * width
+            groups.append(
+                Group(
+                    f"g{idx}",
+                    [
+                        first + ridx * N + cidx
+                        for ridx in range(height)
+                        for cidx in range(width)
+                    ],
+                    self.AVAILABLE,
+                )
+            )
+        self.groups: tuple[Group, ...] = tuple(groups)
+        # column, row and box of each cell, in the order of self.groups
+        self.ref_size: int = 3
+        self.ref: array = array(typecode(len(groups)))
+        for idx in range(N * N):
+            row, col = divmod(idx, N)
+            box = (row // height) * vgN + col // width
+            self.ref.extend((3 * col, 3 * row + 1, 3 * box + 2))
+        self.peers_size: int = 2 * (N - 1) + (height - 1) * (width - 1)
+        self.peers: array = array(typecode(N * N))
+        for idx in range(N * N):
+            peers = set()
+            for gidx in self.ref[idx * 3 : idx * 3 + 3]:
+                peers.update(groups[gidx].cells)
+            peers.discard(idx)
+            self.peers.extend(sorted(peers))
+        # group indices of the rows and of the columns, in board order
+        self.lines: tuple[tuple[int, ...], tuple[int, ...]] = (
+            tuple(range(1, 3 * N, 3)),
+            tuple(range(0, 3 * N, 3)),
+        )
+        self.pairs: dict[str, list[tuple[int, int]]] = self.__make_pairs()
+        self.__values = tuple(itemgetter(*group.cells) for group in groups)
+
+    def __make_pairs(self) -> dict[str, list[tuple[int, int]]]:
+        """
+        per group name A, for every group B sharing at least two cells with it:
+        the cell masks of A - B and B - A
+        """
+        pairs: dict[str, list[tuple[int, int]]] = {
+            group.name: list() for group in self.groups
+        }
+        shared: dict[tuple[int, int], int] = dict()
+        for idx in range(self.N * self.N):
+            refs = self.ref[idx * self.ref_size : (idx + 1) * self.ref_size]
+            for pair in combinations(sorted(refs), 2):
+                shared[pair] = shared.get(pair, 0) + 1
+        for pair, count in shared.items():
+            if count < 2:
+                continue
+            for a, b in (pair, pair[::-1]):
+                group, other = self.groups[a], self.groups[b]
+                pairs[group.name].append(
+                    (group.mask & ~other.mask, other.mask & ~group.mask)
+                )
+        return pairs
+
+    @classmethod
+    def of(cls, N: int, hgN: int, vgN: int) -> "Topology":
+        topology = cls.__cache.get((N, hgN, vgN))
+        if topology is None:
+            topology = cls.__cache[(N, hgN, vgN)] = cls(N, hgN, vgN)
+        return topology
+
+    def is_valid(self, board: Sequence[int], complete: bool = False) -> bool:
+        """
+        N * N cells from 0 to N and no number twice in a group: per group, the
+        numbers OR-ed into a bitmask must have as many bits as it has filled cells\n
+        complete: empty cells make the board invalid too (a solution)
+        """
+        if len(board) != self.N * self.N:
+            return False
+        if max(board) > self.N or min(board) < (1 if complete else 0):
+            return False
+        for values in self.__values:
+            numbers = values(board)
+            seen = 0
+            for number in numbers:
+                seen |= 1 << number
+            if (seen >> 1).bit_count() != len(numbers) - numbers.count(0):
+                return False
+        return True
+
+    def validate(
+        self, boards: Sequence[Sequence[int]], complete: bool = False
+    ) -> list[bool]:
+        """
+        is_valid() of each board, vectorized.valid_boards() when numpy is installed
+        """
+        if vectorized.available() and len(boards):
+            try:
+                return vectorized.valid_boards(
+                    boards, self.N, self.hgN, self.vgN, complete
+                ).tolist()
+            except (ValueError, OverflowError):  # ragged boards, too large values
+                pass
+        return [self.is_valid(board, complete) for board in boards]
@@ -0,0 +1,170 @@
+import random
+from typing import Iterable
+
+import vectorized
+
+np = vectorized.np
+
+
+class Transform:
+    """
+    A validity-preserving symmetry of SudokuNxN boards with the given N, hgN, vgN,
+    stored as one gather: apply(board)[idx] = numbers[board[cells[idx]]]\n
+    cells: source cell of each cell\n
+    numbers: new value of each value, numbers[0] = 0 keeps empty cells empty\n
+    """
+
+    def __init__(
+        self,
+        N: int,
+        hgN: int,
+        vgN: int,
+        cells: list[int] | None = None,
+        numbers: list[int] | None = None,
+    ):
+        self._N: int = N
+        self._hgN: int = hgN
+        self._vgN: int = vgN
+        self.cells: list[int] = cells if cells is not None else list(range(N * N))
+        self.numbers: list[int] = (
+            numbers if numbers is not None else list(range(N + 1))
+        )
+
+    @classmethod
+    def rows(cls, N: int, hgN: int, vgN: int, order: list[int]) -> "Transform":
+        """
+        new row r is old row order[r]; order must keep rows inside bands
+        (it may still move whole bands)
+        """
+        return cls(N, hgN, vgN, [order[idx // N] * N + idx % N for idx in range(N * N)])
+
+    @classmethod
+    def columns(cls, N: int, hgN: int, vgN: int, order: list[int]) -> "Transform":
+        """
+        new column c is old column order[c]; order must keep columns inside stacks
+        """
+        return cls(N, hgN, vgN, [idx - idx % N + order[idx % N] for idx in range(N * N)])
+
+    @classmethod
+    def transpose(cls, N: int, hgN: int, vgN: int) -> "Transform":
+        """
+        only for square boxes, otherwise the box shape would change
+        """
+        if hgN != vgN:
+            raise Exception("Transposition needs square boxes")
+        return cls(N, hgN, vgN, [idx % N * N + idx // N for idx in range(N * N)])
+
+    @classmethod
+    def rotate(cls, N: int, hgN: int, vgN: int, quarter_turns: int = 1) -> "Transform":
+        """
+        clockwise; odd quarter turns only for square boxes
+        """
+        quarter_turns %= 4
+        transform = cls(N, hgN, vgN)
+        if quarter_turns % 2:
+            transform = transform.then(cls.transpose(N, hgN, vgN)).then(
+                cls.columns(N, hgN, vgN, list(reversed(range(N))))
+            )
+            quarter_turns -= 1
+        if quarter_turns:
+            transform = transform.then(
+                cls.rows(N, hgN, vgN, list(reversed(range(N))))
+            ).then(cls.columns(N, hgN, vgN, list(reversed(range(N)))))
+        return transform
+
+    @classmethod
+    def relabel(cls, N: int, hgN: int, vgN: int, numbers: list[int]) -> "Transform":
+        """
+        numbers: new value of 1..N, in order
+        """
+        return cls(N, hgN, vgN, numbers=[0, *numbers])
+
+    @classmethod
+    def random(cls, N: int, hgN: int, vgN: int) -> "Transform":
+        """
+        relabeling, band / stack permutations, row / column permutations inside
+        them and, for square boxes, a random rotation or transposition
+        """
+        transform = cls.relabel(N, hgN, vgN, random.sample(range(1, N + 1), N))
+        transform = transform.then(
+            cls.rows(N, hgN, vgN, _random_order(hgN, N // hgN))
+        ).then(cls.columns(N, hgN, vgN, _random_order(vgN, N // vgN)))
+        if hgN == vgN:
+            if random.getrandbits(1):
+                transform = transform.then(cls.transpose(N, hgN, vgN))
+            transform = transform.then(cls.rotate(N, hgN, vgN, random.randrange(4)))
+        elif random.getrandbits(1):
+            transform = transform.then(cls.rotate(N, hgN, vgN, 2))
+        return transform
+
+    def then(self, other: "Transform") -> "Transform":
+        """
+        self, then other, as a single gather
+        """
+        return Transform(
+            self._N,
+            self._hgN,
+            self._vgN,
+            [self.cells[cell] for cell in other.cells],
+            [other.numbers[number] for number in self.numbers],
+        )
+
+    def inverse(self) -> "Transform":
+        cells = [0 for _ in self.cells]
+        for idx, cell in enumerate(self.cells):
+            cells[cell] = idx
+        numbers = [0 for _ in self.numbers]
+        for number, new in enumerate(self.numbers):
+            numbers[new] = number
+        return Transform(self._N, self._hgN, self._vgN, cells, numbers)
+
+    def apply(self, board: list[int]) -> list[int]:
+        numbers = self.numbers
+        return [numbers[board[cell]] for cell in self.cells]
+
+    def apply_many(self, boards: Iterable[list[int]]) -> list[list[int]]:
+        """
+        one fancy-indexing gather over the whole batch when numpy is available
+        """
+        if np is None:
+            return [self.apply(board) for board in boards]
+        array = np.asarray(list(boards), dtype=np.int32).reshape(-1, self._N * self._N)
+        return np.asarray(self.numbers, dtype=np.int32)[
+            array[:, np.asarray(self.cells)]
+        ].tolist()
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Transform)
+            and self.cells == other.cells
+            and self.numbers == other.numbers
+        )
+
+    def __str__(self) -> str:
+        return f"cells: {self.cells}\nnumbers: {self.numbers}"
+
+
+def augment(
+    board: list[int], N: int, hgN: int, vgN: int, count: int
+) -> list[list[int]]:
+    """
+    count random symmetric copies of board
+    """
+    if np is None:
+        return [Transform.random(N, hgN, vgN).apply(board) for _ in range(count)]
+    transforms = [Transform.random(N, hgN, vgN) for _ in range(count)]
+    cells = np.asarray([transform.cells for transform in transforms])
+    numbers = np.asarray([transform.numbers for transform in transforms])
+    gathered = np.asarray(board, dtype=np.int32)[cells]
+    return np.take_along_axis(numbers, gathered, axis=1).tolist()
+
+
+def _random_order(groups: int, size: int) -> list[int]:
+    """
+    a line order that permutes the groups of size lines and the lines inside each
+    """
+    return [
+        group * size + line
+        for group in random.sample(range(groups), groups)
+        for line in random.sample(range(size), size)
+    ]
@@ -22,3 +22,14 @@ def flatten(obj: Any) -> list[Any]:
         return result
     except TypeError:
         return [obj]
+
+
+def typecode(maximum: int) -> str:
+    """
+    the smallest unsigned array.array typecode holding 0 to maximum
+    """
+    if maximum < 1 << 8:
+        return "B"
+    if maximum < 1 << 16:
+        return "H"
+    return "L"
@@ -57,6 +57,10 @@ SUDOKU_TYPE = Literal[
     "20x20h",
     "20x20v",
     "25x25",
+    "36x36",
+    "64x64",
+    "100x100",
+    "121x121",
     "jigsaw",
     "greater than",
     "consecutive",
@@ -72,3 +76,9 @@ SUDOKU_TYPE = Literal[
 ]
 
 LOG_LEVEL = Literal["debug", "info"]
+
+BACKEND = Literal["auto", "python", "numpy"]
+
+DIFFICULTY = Literal["easy", "medium", "hard", "expert"]
+
+STATUS = Literal["solved", "unsolvable", "timeout"]
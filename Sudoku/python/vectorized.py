@@ -0,0 +1,191 @@
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only the large grids use it
+    np = None
+
+# "auto" backend switches minimum_case_first to numpy from this N on, None never:
+# benchmark.py has numpy slower than the optimized python search at every size
+# measured (9x9 to 36x36)
+AUTO_MIN_N: int | None = None
+
+
+def available() -> bool:
+    return np is not None
+
+
+class CandidateTensor:
+    """
+    (N, N, N) boolean candidate tensor of a SudokuNxN board: [row, column, number - 1]\n
+    hgN / vgN as in SudokuNxN, so a box is N / hgN rows by N / vgN columns\n
+    """
+
+    def __init__(self, board: list[int], N: int, hgN: int, vgN: int):
+        if np is None:
+            raise Exception("numpy is not installed")
+        self._N: int = N
+        self._hgN: int = hgN
+        self._vgN: int = vgN
+        self.board = np.array(board, dtype=np.int32).reshape(N, N)
+        self.candidates = np.zeros((N, N, N), dtype=bool)
+        self.nodes: int = 0
+        self.backtracks: int = 0
+        self.propagations: int = 0
+        self.max_depth: int = 0
+        self.timed_out: bool = False
+
+    def propagate(self) -> bool:
+        """
+        places naked and hidden singles (rows, columns, boxes) until none is left\n
+        returns False if the board turns out to be contradictory
+        """
+        N, hgN, vgN = self._N, self._hgN, self._vgN
+        height, width = N // hgN, N // vgN
+        count = int(np.count_nonzero(self.board))
+        while True:
+            filled = self.board > 0
+            filled_count = int(filled.sum())
+            self.propagations += filled_count - count  # placed by the last pass
+            count = filled_count
+            placed = np.zeros((N, N, N), dtype=bool)
+            rows, columns = np.nonzero(filled)
+            placed[rows, columns, self.board[rows, columns] - 1] = True
+
+            row_used = placed.sum(axis=1)
+            column_used = placed.sum(axis=0)
+            box_used = placed.reshape(hgN, height, vgN, width, N).sum(axis=(1, 3))
+            if row_used.max() > 1 or column_used.max() > 1 or box_used.max() > 1:
+                return False
+
+            self.candidates = ~(
+                (row_used[:, None, :] > 0)
+                | (column_used[None, :, :] > 0)
+                | np.repeat(np.repeat(box_used > 0, height, axis=0), width, axis=1)
+            )
+            self.candidates[filled] = False
+
+            counts = self.candidates.sum(axis=2)
+            empty = ~filled
+            if (counts[empty] == 0).any():
+                return False
+            if not empty.any():
+                return True
+
+            row_count = self.candidates.sum(axis=1)
+            column_count = self.candidates.sum(axis=0)
+            box_count = self.candidates.reshape(hgN, height, vgN, width, N).sum(
+                axis=(1, 3)
+            )
+            if (
+                ((row_count == 0) & (row_used == 0)).any()
+                or ((column_count == 0) & (column_used == 0)).any()
+                or ((box_count == 0) & (box_used == 0)).any()
+            ):
+                return False
+
+            progress = False
+
+            rows, columns = np.nonzero(empty & (counts == 1))
+            if len(rows):
+                self.board[rows, columns] = (
+                    self.candidates[rows, columns].argmax(axis=1) + 1
+                )
+                progress = True
+
+            rows, numbers = np.nonzero(row_count == 1)
+            if len(rows):
+                columns = self.candidates[rows, :, numbers].argmax(axis=1)
+                self.board[rows, columns] = numbers + 1
+                progress = True
+
+            columns, numbers = np.nonzero(column_count == 1)
+            if len(columns):
+                rows = self.candidates[:, columns, numbers].argmax(axis=0)
+                self.board[rows, columns] = numbers + 1
+                progress = True
+
+            box_rows, box_columns, numbers = np.nonzero(box_count == 1)
+            if len(numbers):
+                boxes = self.candidates.reshape(hgN, height, vgN, width, N)[
+                    box_rows, :, box_columns, :, numbers
+                ].reshape(len(numbers), height * width)
+                local = boxes.argmax(axis=1)
+                self.board[
+                    box_rows * height + local // width,
+                    box_columns * width + local % width,
+                ] = (numbers + 1)
+                progress = True
+
+            if not progress:
+                return True
+
+    def solve(self, deadline: float | None = None) -> bool | None:
+        """
+        propagate(), then branch on the empty cell with the fewest candidates,
+        keeping a copy of the board per level on an explicit stack\n
+        deadline: time.perf_counter() value after which it returns None
+        """
+        self.nodes += 1
+        if not self.propagate():
+            return False
+        stack: list[tuple["np.ndarray", int, int, list[int]]] = list()
+        while True:
+            empty = self.board == 0
+            if not empty.any():
+                return True
+            counts = np.where(empty, self.candidates.sum(axis=2), self._N + 1)
+            row, column = divmod(int(counts.argmin()), self._N)
+            numbers = (np.nonzero(self.candidates[row, column])[0] + 1).tolist()
+            stack.append((self.board.copy(), row, column, numbers))
+            self.max_depth = max(self.max_depth, len(stack))
+            while stack:
+                if deadline is not None and time.perf_counter() > deadline:
+                    self.timed_out = True
+                    return None
+                board, row, column, numbers = stack[-1]
+                if not numbers:
+                    stack.pop()
+                    self.backtracks += 1
+                    continue
+                self.board = board.copy()
+                self.board[row, column] = numbers.pop(0)
+                self.nodes += 1
+                if self.propagate():
+                    break
+                self.backtracks += 1
+            else:
+                return False
+
+    def flatten(self) -> list[int]:
+        return self.board.reshape(-1).tolist()
+
+
+def valid_boards(
+    boards: "np.ndarray | list[list[int]]",
+    N: int,
+    hgN: int,
+    vgN: int,
+    complete: bool = False,
+) -> "np.ndarray":
+    """
+    Topology.is_valid() of every row of a (count, N * N) array at once: each
+    column, row and box is sorted and no filled cell may equal the next one\n
+    complete: empty cells make a board invalid too (a solution)
+    """
+    if np is None:
+        raise Exception("numpy is not installed")
+    boards = np.asarray(boards)
+    if boards.ndim != 2 or boards.shape[1] != N * N:
+        raise ValueError(f"Expected (count, {N * N}) boards, got {boards.shape}")
+    height, width = N // hgN, N // vgN
+    count = len(boards)
+    grid = boards.reshape(count, N, N)
+    boxes = grid.reshape(count, hgN, height, vgN, width).transpose(0, 1, 3, 2, 4)
+    groups = np.concatenate(
+        (grid, grid.transpose(0, 2, 1), boxes.reshape(count, N, N)), axis=1
+    )
+    ordered = np.sort(groups, axis=2)
+    repeated = (ordered[:, :, 1:] == ordered[:, :, :-1]) & (ordered[:, :, 1:] > 0)
+    in_range = (boards >= (1 if complete else 0)) & (boards <= N)
+    return in_range.all(axis=1) & ~repeated.any(axis=(1, 2))